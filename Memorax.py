@@ -9,6 +9,26 @@ import webbrowser
 import json
 from tkinter import simpledialog  # Add import for simpledialog
 from tkinter import colorchooser  # Add import for colorchooser
+import sqlite3
+import threading
+import fnmatch
+import sys
+import asyncio
+import argparse
+import uuid
+import codecs
+import zlib
+import bisect
+import csv
+import html
+import base64
+import struct
+import zipfile
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs, unquote
 
 # Add DPI awareness
 try:
@@ -17,6 +37,11 @@ try:
 except:
     pass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # The review dashboard needs NumPy, everything else works without it
+
 if os.name == 'nt':  # Windows
     CONFIG_DIR = os.path.join(os.getenv('USERPROFILE'), 'Documents', 'MemoHelper')
 else:  # Unix-like (Linux, macOS, etc.)
@@ -24,6 +49,10 @@ else:  # Unix-like (Linux, macOS, etc.)
 
 os.makedirs(CONFIG_DIR, exist_ok=True)
 CONFIG_FILE = os.path.join(CONFIG_DIR, '.memo_helper_config.json')
+LIBRARY_FILE = os.path.join(CONFIG_DIR, '.memo_helper_library.db')
+BUNDLE_FOLDER = os.path.join(CONFIG_DIR, 'bundles')  # Assets extracted from deck bundles
+HISTORY_FILE = os.path.join(CONFIG_DIR, '.memo_helper_history.bin')
+HISTORY_NAMES_FILE = os.path.join(CONFIG_DIR, '.memo_helper_history_names.json')
 
 def load_config():
     try:
@@ -38,11 +67,30 @@ def save_config(config):
 
 def read_file(file_path):
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.readlines()
+        with open(file_path, 'rb') as file:
+            data = file.read()
     except FileNotFoundError:
         messagebox.showerror("Error", f"File not found: {file_path}")
         return []
+    return data.decode(detect_encoding(data), errors='replace').splitlines(keepends=True)
+
+ENCODING_PROBE_SIZE = 65536
+
+def detect_encoding(data):
+    # BOM first, then a UTF-8 probe of the leading bytes, falling back to GB18030 (a superset of GBK)
+    if data.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if data.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(data[:ENCODING_PROBE_SIZE], final=len(data) <= ENCODING_PROBE_SIZE)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'gb18030'
+
+def detect_file_encoding(file_path):
+    with open(file_path, 'rb') as file:
+        return detect_encoding(file.read(ENCODING_PROBE_SIZE + 1))
 
 class SectionTitle:
     def __init__(self, level, title):
@@ -53,16 +101,54 @@ class SectionTitle:
     def add_subsection(self, subsection):
         self.subsections.append(subsection)
 
+INLINE_PATTERN = re.compile(r'`([^`\n]+)`|\*\*(.+?)\*\*|__(.+?)__|(?<![\w*])\*([^*\s][^*]*?)(?<!\s)\*(?![\w*])|!\[([^\]\n]*)\]\(([^)\s]+)\)|\[([^\]\n]+)\]\(([^)\s]+)\)', re.S)
+INLINE_TAGS = {1: "code", 2: "bold", 3: "bold", 4: "italic", 6: "image", 8: "link"}  # Keyed by the last matched group
+
+def tokenize_inline(content):
+    # Strip inline markdown once and return (display text, (offset, length, tag) runs, image and link urls)
+    if not content or not ('*' in content or '`' in content or '[' in content or '__' in content):
+        return content, (), ()
+    if not INLINE_PATTERN.search(content):
+        return content, (), ()
+    parts = []
+    runs = []
+    links = []
+    offset = 0
+    last = 0
+    for match in INLINE_PATTERN.finditer(content):
+        parts.append(content[last:match.start()])
+        offset += match.start() - last
+        tag = INLINE_TAGS[match.lastindex]
+        text = match.group(match.lastindex - 1 if tag in ("image", "link") else match.lastindex)
+        runs.append((offset, len(text), tag))
+        if tag in ("image", "link"):
+            links.append(match.group(match.lastindex))
+        parts.append(text)
+        offset += len(text)
+        last = match.end()
+    parts.append(content[last:])
+    return ''.join(parts), tuple(runs), tuple(links)
+
+def section_path_id(section_titles):
+    # Stable id for a section path, shared by every loader and by the review history
+    return zlib.crc32(SECTION_SEPARATOR.join(section_titles).encode('utf-8'))
+
 class Entry:
-    def __init__(self, indent_level, title, content, section_titles):
+    def __init__(self, indent_level, title, content, section_titles, section_id=None):
         self.indent_level = indent_level
         self.title = title
         self.content = content
         self.section_titles = section_titles
+        self.section_id = section_path_id(section_titles) if section_id is None else section_id
+        self.display_content, self.inline_runs, self.links = tokenize_inline(content)
 
 def parse_entries(lines):
-    entries = []
+    return list(iter_entries(lines))
+
+def iter_entries(lines):
+    # Yield entries one at a time so callers can stream over large files
     section_stack = []
+    section_id = section_path_id([])
     for line in lines:
         line = line.rstrip()
         if re.match(r'^#+\s*(.*)', line):
@@ -74,6 +160,7 @@ def parse_entries(lines):
             if section_stack:
                 section_stack[-1].add_subsection(new_section)
             section_stack.append(new_section)
+            section_id = section_path_id([section.title for section in section_stack])
         match = re.match(r'^\s*([-•\d]+)\s*(.*?)(：|:)(.*)', line)
         if match:
             indent_level = len(re.match(r'^\s*', line).group())
@@ -81,15 +168,383 @@ def parse_entries(lines):
             content = match.group(4).strip()
             content = content.replace('；', '；\n').replace('。', '。\n')
             section_titles = [section.title for section in section_stack]
-            entries.append(Entry(indent_level, title, content, section_titles))
+            yield Entry(indent_level, title, content, section_titles, section_id)
         elif re.match(r'^\s*[-•\d]+\s*(.*)', line):
             indent_level = len(re.match(r'^\s*', line).group())
             content = re.match(r'^\s*[-•\d]+\s*(.*)', line).group(1).strip()
             content = content.replace('；', '；\n').replace('。', '。\n')
             section_titles = [section.title for section in section_stack]
-            entries.append(Entry(indent_level, None, content, section_titles))
+            yield Entry(indent_level, None, content, section_titles, section_id)
+
+SECTION_SEPARATOR = '\x1f'  # Joins section titles into one section path string
+CJK_CHAR_PATTERN = re.compile(r'([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af])')
+
+def segment_cjk(text):
+    # Put spaces around CJK characters so FTS5 indexes each one as its own token
+    return CJK_CHAR_PATTERN.sub(r' \1 ', text or '')
+
+BYTE_PATTERNS = {}
+LINE_BREAKS = bytes.maketrans(b'\r\x0b\x0c\x1c\x1d\x1e', b'\n' * 6)  # ASCII line breaks of str.splitlines
+UNICODE_LINE_BREAKS = ('\x85', '\u2028', '\u2029')
+ENTRY_COLON = re.compile('[:：]')
+LINE_BREAK_SEARCHES = {}
+
+def has_unicode_line_breaks(data, encoding):
+    # One literal regex per character: sre scans for a literal prefix much faster than bytes.__contains__
+    if encoding not in LINE_BREAK_SEARCHES:
+        LINE_BREAK_SEARCHES[encoding] = [re.compile(re.escape(char.encode(encoding))) for char in UNICODE_LINE_BREAKS]
+    return any(search.search(data) for search in LINE_BREAK_SEARCHES[encoding])
+
+def byte_alternation(chars, encoding):
+    # Regex matching any one of chars as encoded bytes, nested by leading byte so a line start is rejected quickly
+    def group(sequences):
+        branches = []
+        for lead in sorted({sequence[:1] for sequence in sequences}):
+            tails = [sequence[1:] for sequence in sequences if sequence[:1] == lead and sequence[1:]]
+            if not tails:
+                branches.append(re.escape(lead))
+            elif all(len(tail) == 1 for tail in tails):
+                branches.append(re.escape(lead) + b'[' + b''.join(re.escape(tail) for tail in sorted(tails)) + b']')
+            else:
+                branches.append(re.escape(lead) + group(tails))
+        return b'(?:' + b'|'.join(branches) + b')'
+    return group(sorted({char.encode(encoding) for char in chars}))
+
+def byte_patterns(encoding):
+    # Compiled per encoding to accept what parse_entries accepts: every Unicode whitespace (\s) and
+    # decimal digit (\d) as its encoded byte sequence. Line starts are character boundaries in
+    # UTF-8 and GB18030, and both are prefix codes, so each alternative consumes whole characters
+    if encoding not in BYTE_PATTERNS:
+        non_ascii = [chr(code) for code in range(0x80, 0x20000)]  # Planes beyond have no spaces or digits
+        spaces = [char for char in non_ascii if char.isspace() and char not in UNICODE_LINE_BREAKS]
+        markers = [char for char in non_ascii if char.isdecimal()] + ['•']  # What \d matches in str patterns
+        BYTE_PATTERNS[encoding] = re.compile(
+            rb'^(?:(#+)([^\n]*)'
+            rb'|((?:[ \t\x1f]|' + byte_alternation(spaces, encoding) + rb')*)'
+            rb'(?:[-0-9]|' + byte_alternation(markers, encoding) + rb')+([^\n]*))',
+            re.MULTILINE)
+    return BYTE_PATTERNS[encoding]
+
+def parse_entries_bytes(data, encoding=None):
+    # Fast path: scan raw bytes and decode only headings and the text after entry markers
+    encoding = encoding or detect_encoding(data)
+    if encoding in ('utf-8-sig', 'utf-16') or has_unicode_line_breaks(data, encoding):
+        return parse_entries(data.decode(encoding, errors='replace').splitlines())
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n')
+    if any(byte in data for byte in (b'\r', b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e')):
+        data = data.translate(LINE_BREAKS)
+    entries = []
+    section_stack = []
+    section_titles = []
+    section_id = section_path_id(section_titles)
+    for match in byte_patterns(encoding).finditer(data):
+        hashes, heading, indent, rest = match.groups()
+        if hashes:
+            level = len(hashes)
+            while section_stack and section_stack[-1].level >= level:
+                section_stack.pop()
+            new_section = SectionTitle(level, heading.decode(encoding, errors='replace').strip())
+            if section_stack:
+                section_stack[-1].add_subsection(new_section)
+            section_stack.append(new_section)
+            section_titles = [section.title for section in section_stack]
+            section_id = section_path_id(section_titles)
+            continue
+        indent_level = len(indent) if indent.isascii() else len(indent.decode(encoding))
+        # The colon is found after decoding: a full-width colon's bytes can straddle two GB18030 characters
+        parts = ENTRY_COLON.split(rest.decode(encoding, errors='replace'), 1)
+        title = parts[0].strip() if len(parts) == 2 else None
+        content = parts[-1].strip().replace('；', '；\n').replace('。', '。\n')
+        entries.append(Entry(indent_level, title, content, section_titles, section_id))  # Entries of a section share its titles list
     return entries
 
+def parse_file(file_path):
+    with open(file_path, 'rb') as file:
+        return parse_entries_bytes(file.read())
+
+class DeckLibrary:
+    def __init__(self, db_path=LIBRARY_FILE):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.lock = threading.Lock()
+        self.create_schema()
+
+    def create_schema(self):
+        with self.conn:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sections (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    id INTEGER PRIMARY KEY,
+                    file_id INTEGER NOT NULL REFERENCES files(id),
+                    position INTEGER NOT NULL,
+                    indent_level INTEGER NOT NULL,
+                    title TEXT,
+                    content TEXT NOT NULL,
+                    section_id INTEGER NOT NULL REFERENCES sections(id)
+                );
+                CREATE INDEX IF NOT EXISTS entries_file_position ON entries(file_id, position);
+                CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(title, content, section);
+            ''')
+
+    def close(self):
+        self.conn.close()
+
+    def get_fingerprint(self, path):
+        row = self.conn.execute('SELECT id, mtime_ns, size FROM files WHERE path = ?', (path,)).fetchone()
+        return row
+
+    def section_id(self, section_titles):
+        path = SECTION_SEPARATOR.join(section_titles)
+        row = self.conn.execute('SELECT id FROM sections WHERE path = ?', (path,)).fetchone()
+        if row:
+            return row[0]
+        return self.conn.execute('INSERT INTO sections (path) VALUES (?)', (path,)).lastrowid
+
+    def remove_file(self, file_id):
+        self.conn.execute('DELETE FROM entries_fts WHERE rowid IN (SELECT id FROM entries WHERE file_id = ?)', (file_id,))
+        self.conn.execute('DELETE FROM entries WHERE file_id = ?', (file_id,))
+        self.conn.execute('DELETE FROM files WHERE id = ?', (file_id,))
+
+    def ingest_file(self, path, stat=None):
+        path = os.path.abspath(path)
+        if stat is None:
+            stat = os.stat(path)
+        try:
+            entries = parse_file(path)
+        except OSError:
+            return False
+        with self.lock, self.conn:
+            row = self.get_fingerprint(path)
+            if row:
+                self.remove_file(row[0])
+            file_id = self.conn.execute('INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)',
+                                        (path, stat.st_mtime_ns, stat.st_size)).lastrowid
+            section_ids = {}
+            for position, entry in enumerate(entries):
+                key = tuple(entry.section_titles)
+                if key not in section_ids:
+                    section_ids[key] = self.section_id(entry.section_titles)
+                entry_id = self.conn.execute(
+                    'INSERT INTO entries (file_id, position, indent_level, title, content, section_id) VALUES (?, ?, ?, ?, ?, ?)',
+                    (file_id, position, entry.indent_level, entry.title, entry.content, section_ids[key])).lastrowid
+                self.conn.execute('INSERT INTO entries_fts (rowid, title, content, section) VALUES (?, ?, ?, ?)',
+                                  (entry_id, segment_cjk(entry.title), segment_cjk(entry.content), segment_cjk(' '.join(key))))
+        return True
+
+    def is_stale(self, path, stat):
+        row = self.get_fingerprint(path)
+        return row is None or row[1] != stat.st_mtime_ns or row[2] != stat.st_size
+
+    def ingest_folder(self, folder, pattern='*.md'):
+        # Only reparse files whose mtime or size changed since the last ingest
+        folder = os.path.abspath(folder)
+        seen = set()
+        updated = 0
+        for dir_path, dir_names, file_names in os.walk(folder):
+            for file_name in fnmatch.filter(file_names, pattern):
+                path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                if self.is_stale(path, stat) and self.ingest_file(path, stat):
+                    updated += 1
+        prefix = os.path.join(folder, '')
+        with self.lock, self.conn:
+            rows = self.conn.execute("SELECT id, path FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)).fetchall()
+            for file_id, path in rows:
+                if path not in seen:
+                    self.remove_file(file_id)
+        return updated
+
+    def load_entries(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if self.is_stale(path, stat):
+            self.ingest_file(path, stat)
+        rows = self.conn.execute('''
+            SELECT e.indent_level, e.title, e.content, s.path FROM entries e
+            JOIN files f ON f.id = e.file_id
+            JOIN sections s ON s.id = e.section_id
+            WHERE f.path = ? ORDER BY e.position
+        ''', (path,)).fetchall()
+        section_titles = {}
+        entries = []
+        for indent_level, title, content, section_path in rows:
+            if section_path not in section_titles:
+                titles = section_path.split(SECTION_SEPARATOR) if section_path else []
+                section_titles[section_path] = (titles, section_path_id(titles))
+            titles, section_id = section_titles[section_path]
+            entries.append(Entry(indent_level, title, content, list(titles), section_id))
+        return entries
+
+    def search(self, query, limit=200):
+        terms = ['"%s"' % ' '.join(segment_cjk(term).split()).replace('"', '""') for term in query.split()]
+        if not terms:
+            return []
+        return self.conn.execute('''
+            SELECT f.path, e.position, e.title, e.content FROM entries_fts
+            JOIN entries e ON e.id = entries_fts.rowid
+            JOIN files f ON f.id = e.file_id
+            WHERE entries_fts MATCH ? ORDER BY rank LIMIT ?
+        ''', (' '.join(terms), limit)).fetchall()
+
+DEDUP_TOKEN_PATTERN = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]|[^\W_]+')
+MINHASH_SIZE = 128
+LSH_BANDS = 32  # 32 bands of 4 rows: pairs above ~0.45 similarity usually share a bucket
+MAX_BUCKET_SIZE = 100  # Cap bucket growth so boilerplate entries cannot make the search quadratic
+
+def entry_shingles(entry, size=3):
+    # CJK characters are single tokens and other scripts split on words, then tokens are joined into k-grams
+    tokens = DEDUP_TOKEN_PATTERN.findall(f"{entry.title or ''} {entry.content or ''}".lower())
+    if len(tokens) <= size:
+        return {zlib.crc32(' '.join(tokens).encode('utf-8'))} if tokens else set()
+    return {zlib.crc32(' '.join(tokens[i:i + size]).encode('utf-8')) for i in range(len(tokens) - size + 1)}
+
+def minhash_signature(shingles):
+    # One-permutation MinHash: each shingle hash is hashed once and kept as the minimum of its bin,
+    # empty bins borrow from the next filled bin so sparse entries still get a full signature
+    bins = [None] * MINHASH_SIZE
+    for value in shingles:
+        mixed = (value * 0x9E3779B1 + 0x7F4A7C15) & 0xFFFFFFFF
+        position = mixed % MINHASH_SIZE
+        if bins[position] is None or mixed < bins[position]:
+            bins[position] = mixed
+    if None not in bins:
+        return bins
+    signature = list(bins)
+    borrowed, offset = None, 0
+    for position in range(2 * MINHASH_SIZE - 1, -1, -1):  # Walk the ring backwards twice to find each bin's next filled bin
+        value = bins[position % MINHASH_SIZE]
+        if value is not None:
+            borrowed, offset = value, 0
+        else:
+            offset += 1
+            if position < MINHASH_SIZE and borrowed is not None:
+                signature[position] = borrowed + offset * 0x100000000
+    return signature
+
+def find_near_duplicates(decks, threshold=0.6):
+    # decks is a list of (path, entries); returns (similarity, (path, index), (path, index)) best first
+    keys = []
+    shingle_sets = []
+    buckets = {}
+    candidates = set()
+    rows = MINHASH_SIZE // LSH_BANDS
+    for path, entries in decks:
+        for index, entry in enumerate(entries):
+            shingles = entry_shingles(entry)
+            if not shingles:
+                continue
+            item = len(keys)
+            keys.append((path, index))
+            shingle_sets.append(shingles)
+            signature = minhash_signature(shingles)
+            for band in range(LSH_BANDS):
+                bucket = buckets.setdefault((band, tuple(signature[band * rows:(band + 1) * rows])), [])
+                if len(bucket) < MAX_BUCKET_SIZE:
+                    candidates.update((other, item) for other in bucket)
+                    bucket.append(item)
+    duplicates = []
+    for first, second in candidates:
+        a, b = shingle_sets[first], shingle_sets[second]
+        similarity = len(a & b) / len(a | b)
+        if similarity >= threshold:
+            duplicates.append((similarity, keys[first], keys[second]))
+    duplicates.sort(key=lambda duplicate: -duplicate[0])
+    return duplicates
+
+REVIEW_RECORD = struct.Struct('<dIIIb')  # time, deck id, entry index, section id, grade (1 remembered, 0 forgot)
+DAY = 86400.0
+
+class ReviewHistory:
+    # Append-only binary log of graded reviews, laid out so NumPy can load it in one call
+    def __init__(self, path=HISTORY_FILE, names_path=HISTORY_NAMES_FILE):
+        self.path = path
+        self.names_path = names_path
+        try:
+            with open(names_path, 'r', encoding='utf-8') as file:
+                self.names = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.names = {"decks": {}, "sections": {}}
+
+    def record(self, deck_path, entry_index, entry, grade, timestamp=None):
+        deck_id = zlib.crc32(os.path.abspath(deck_path).encode('utf-8'))
+        with open(self.path, 'ab') as file:
+            file.write(REVIEW_RECORD.pack(timestamp or time.time(), deck_id, entry_index, entry.section_id, grade))
+        decks, sections = self.names["decks"], self.names["sections"]
+        if str(deck_id) not in decks or str(entry.section_id) not in sections:
+            decks[str(deck_id)] = os.path.basename(deck_path)
+            sections[str(entry.section_id)] = " > ".join(entry.section_titles)
+            with open(self.names_path, 'w', encoding='utf-8') as file:
+                json.dump(self.names, file, ensure_ascii=False)
+
+    def load(self):
+        dtype = np.dtype([('time', '<f8'), ('deck', '<u4'), ('entry', '<u4'), ('section', '<u4'), ('grade', 'i1')])
+        try:
+            return np.fromfile(self.path, dtype=dtype, count=os.path.getsize(self.path) // dtype.itemsize)
+        except OSError:
+            return np.zeros(0, dtype=dtype)
+
+RETENTION_BINS = np.array([0, 1, 2, 4, 7, 14, 30, 60, 120, 365, np.inf]) if np is not None else None
+FORECAST_DAYS = 30
+
+def compute_review_analytics(events, now=None):
+    # Grouped reductions over the whole history with no Python-level loop over events
+    now = time.time() if now is None else now
+    grades = events['grade'].astype(np.float64)
+    analytics = {"events": len(events), "accuracy": float(grades.mean()) if len(events) else 0.0}
+
+    # Dense ids for (deck, entry) items, then one sort that groups each item's reviews in time order
+    item_keys = (events['deck'].astype(np.uint64) << np.uint64(32)) | events['entry'].astype(np.uint64)
+    items, item_ids = np.unique(item_keys, return_inverse=True)
+    times = events['time']
+    start = times.min() if len(events) else 0.0
+    order = np.argsort(item_ids * (times.max() - start + 1.0 if len(events) else 1.0) + (times - start))
+    sorted_items, sorted_times, sorted_grades = item_ids[order], times[order], grades[order]
+
+    # Per-section accuracy, keyed by (deck, section path id), reduced per item first and then per section
+    item_counts = np.bincount(item_ids, minlength=len(items))
+    item_correct = np.bincount(item_ids, weights=grades, minlength=len(items))
+    item_sections = np.zeros(len(items), dtype=np.uint64)
+    item_sections[item_ids] = (events['deck'].astype(np.uint64) << np.uint64(32)) | events['section'].astype(np.uint64)
+    sections, section_ids = np.unique(item_sections, return_inverse=True)
+    counts = np.bincount(section_ids, weights=item_counts, minlength=len(sections))
+    correct = np.bincount(section_ids, weights=item_correct, minlength=len(sections))
+    analytics["sections"] = ((sections >> np.uint64(32)).astype(np.uint32), (sections & np.uint64(0xFFFFFFFF)).astype(np.uint32),
+                             counts.astype(np.int64), correct / np.maximum(counts, 1))
+
+    # Retention by the time elapsed since the previous review of the same entry
+    repeated = sorted_items[1:] == sorted_items[:-1]
+    elapsed = np.zeros(len(events))
+    elapsed[1:][repeated] = (sorted_times[1:] - sorted_times[:-1])[repeated]
+    bins = np.digitize(elapsed[1:][repeated] / DAY, RETENTION_BINS) - 1
+    bin_counts = np.bincount(bins, minlength=len(RETENTION_BINS) - 1)
+    bin_correct = np.bincount(bins, weights=sorted_grades[1:][repeated], minlength=len(RETENTION_BINS) - 1)
+    analytics["retention"] = (bin_counts, bin_correct / np.maximum(bin_counts, 1))
+
+    # Workload forecast: the next interval doubles after a success and resets to a day after a lapse
+    last = np.ones(len(events), dtype=bool)
+    last[:-1] = ~repeated
+    next_interval = np.where(sorted_grades[last] > 0, np.maximum(elapsed[last] * 2, DAY), DAY)
+    due_days = np.floor((sorted_times[last] + next_interval - now) / DAY).astype(np.int64)
+    analytics["forecast"] = np.bincount(np.clip(due_days, 0, FORECAST_DAYS), minlength=FORECAST_DAYS + 1)[:FORECAST_DAYS]
+    analytics["overdue"] = int(np.count_nonzero(due_days < 0))
+    return analytics
+
 class Theme:
     def __init__(self, name, bg, fg, troughcolor, section_fg, section_bg, title_fg, title_bg, content_fg, content_bg, list_fg, list_bg):
         self.name = name
@@ -120,6 +575,399 @@ class Theme:
         app.random_button.config(bg=self.bg, fg=self.fg)
         app.jump_scrollbar.config(bg=self.bg, troughcolor=self.troughcolor)
 
+def resolve_image_path(deck_folder, url):
+    # Local images only; Tk can decode PNG, GIF and PPM without extra packages
+    if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', url) and not url.startswith('file://'):
+        return None
+    path = os.path.join(deck_folder, unquote(url[len('file://'):] if url.startswith('file://') else url))
+    return os.path.abspath(path) if os.path.isfile(path) else None
+
+class ImageCache:
+    # LRU of decoded, size-scaled PhotoImages bounded by their total pixel count
+    def __init__(self, max_pixels=16000000, max_items=512):
+        self.max_pixels = max_pixels
+        self.max_items = max_items
+        self.images = OrderedDict()  # (path, max_width) -> PhotoImage, or None when decoding failed
+        self.pixels = 0
+
+    def __contains__(self, key):
+        return key in self.images
+
+    def get(self, key):
+        image = self.images.get(key)
+        if key in self.images:
+            self.images.move_to_end(key)
+        return image
+
+    def put(self, key, image):
+        if key in self.images:
+            return
+        self.images[key] = image
+        self.pixels += image.width() * image.height() if image else 0
+        while len(self.images) > 1 and (self.pixels > self.max_pixels or len(self.images) > self.max_items):
+            evicted_key, evicted = self.images.popitem(last=False)
+            self.pixels -= evicted.width() * evicted.height() if evicted else 0
+
+    def decode(self, path, max_width, data=None):
+        key = (path, max_width)
+        if key not in self.images:
+            try:
+                image = tk.PhotoImage(data=data) if data else tk.PhotoImage(file=path)
+                if image.width() > max_width:
+                    image = image.subsample(-(-image.width() // max_width))
+            except tk.TclError:
+                image = None
+            self.put(key, image)
+        return self.get(key)
+
+class ContentRenderer:
+    # Inserts entry content into a Text widget in idle-time chunks, visible region first,
+    # and hides content with an elide tag so showing the same entry again reuses the buffer
+    CHUNK_SIZE = 32768
+
+    def __init__(self, text, image_loader=None):
+        self.text = text
+        self.image_loader = image_loader  # Maps an image url to a PhotoImage or None
+        self.text.tag_configure("hidden", elide=True)
+        self.text.tag_configure("link", foreground="#1A73E8", underline=True)
+        self.text.tag_bind("link", "<Button-1>", self.open_link)
+        self.content = None  # Content currently held in the Text buffer
+        self.position = 0  # How much of self.content has been inserted so far
+        self.hidden = False
+        self.pending = None
+        self.runs = ()  # Inline (offset, length, tag) runs for self.content
+        self.links = ()
+        self.run_urls = {}
+        self.applied = 0  # How many runs have been tagged so far
+        self.line_starts = None
+        self.shifts = {}  # Line -> columns where embedded images were inserted
+        self.font_name = None
+        self.tag_fonts = {}
+
+    def update_tag_fonts(self):
+        # Derive the bold, italic and code fonts from the current content font when it changes
+        font_name = str(self.text.cget("font"))
+        if font_name == self.font_name:
+            return
+        self.font_name = font_name
+        actual = tkfont.Font(font=font_name).actual()
+        self.tag_fonts = {
+            "bold": tkfont.Font(**dict(actual, weight="bold")),
+            "italic": tkfont.Font(**dict(actual, slant="italic")),
+            "code": tkfont.Font(**dict(actual, family="Courier")),
+        }
+        for tag, tag_font in self.tag_fonts.items():
+            self.text.tag_configure(tag, font=tag_font)
+
+    def index(self, offset):
+        line = bisect.bisect_right(self.line_starts, offset)
+        column = offset - self.line_starts[line - 1]
+        if line in self.shifts:
+            column += bisect.bisect_right(self.shifts[line], column)
+        return f"{line}.{column}"
+
+    def apply_runs(self):
+        # One tag_add per tag type for all runs that are fully inserted
+        ranges = {}
+        images = []
+        while self.applied < len(self.runs):
+            offset, length, tag = self.runs[self.applied]
+            if offset + length > self.position:
+                break
+            ranges.setdefault(tag, []).extend((self.index(offset), self.index(offset + length)))
+            if tag == "image":
+                images.append((offset + length, self.run_urls[self.applied]))
+            self.applied += 1
+        for tag, indices in ranges.items():
+            self.text.tag_add(tag, *indices)
+        for offset, url in images:
+            self.insert_image(offset, url)
+
+    def insert_image(self, offset, url):
+        image = self.image_loader(url) if self.image_loader else None
+        if image is None:
+            return
+        index = self.index(offset)
+        self.text.image_create(index, image=image)
+        if self.hidden:
+            self.text.tag_add("hidden", index)
+        line = bisect.bisect_right(self.line_starts, offset)
+        bisect.insort(self.shifts.setdefault(line, []), offset - self.line_starts[line - 1])
+
+    def open_link(self, event):
+        offset = self.text.count(1.0, tk.CURRENT, "chars")
+        offset = offset[0] if offset else 0
+        for run_index, url in self.run_urls.items():
+            start, length, tag = self.runs[run_index]
+            if tag == "link" and start <= offset < start + length:
+                webbrowser.open(url)
+                break
+
+    def visible_size(self, content):
+        # Enough text to fill the widget twice over, ending on a line boundary where possible
+        lines = int(self.text.cget("height")) * 2
+        limit = lines * int(self.text.cget("width")) * 2
+        end = -1
+        for _ in range(lines):
+            end = content.find('\n', end + 1, limit)
+            if end < 0:
+                return limit
+        return end + 1
+
+    def show(self, content, runs=(), links=()):
+        if runs:
+            self.update_tag_fonts()
+        if content != self.content or runs != self.runs:
+            self.cancel()
+            self.text.delete(1.0, tk.END)
+            self.content = content
+            self.position = 0
+            self.hidden = False
+            self.runs = runs
+            self.links = links
+            self.applied = 0
+            self.shifts = {}
+            url_runs = [i for i, run in enumerate(runs) if run[2] in ("image", "link")]
+            self.run_urls = dict(zip(url_runs, links))  # Run index -> image or link url
+            if runs:
+                self.line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+            self.insert_chunk(self.visible_size(content))
+        elif self.hidden:
+            self.text.tag_remove("hidden", 1.0, tk.END)
+            self.hidden = False
+        self.text.see(1.0)
+
+    def hide(self):
+        if self.content is not None and not self.hidden:
+            self.text.tag_add("hidden", 1.0, tk.END)
+            self.hidden = True
+
+    def clear(self):
+        self.cancel()
+        self.text.delete(1.0, tk.END)
+        self.content = None
+        self.hidden = False
+
+    def cancel(self):
+        if self.pending is not None:
+            self.text.after_cancel(self.pending)
+            self.pending = None
+
+    def insert_chunk(self, size=CHUNK_SIZE):
+        self.pending = None
+        end = min(self.position + size, len(self.content))
+        if end < len(self.content):
+            newline = self.content.rfind('\n', self.position, end)
+            if newline > self.position:
+                end = newline + 1
+        self.text.insert(tk.END, self.content[self.position:end], ("hidden",) if self.hidden else ())
+        self.position = end
+        if self.applied < len(self.runs):
+            self.apply_runs()
+        if self.position < len(self.content):
+            self.pending = self.text.after_idle(self.insert_chunk)
+
+class StoreItem:
+    def __init__(self, entries, mtime_ns):
+        self.entries = entries
+        self.mtime_ns = mtime_ns
+        self.size = sum(200 + 2 * (len(entry.title or '') + len(entry.content or '')) for entry in entries)  # Rough bytes
+        self.labels = None
+
+    def jump_labels(self):
+        if self.labels is None:
+            self.labels = [f"{i+1}. {entry.title if entry.title else entry.content}" for i, entry in enumerate(self.entries)]
+        return self.labels
+
+class DeckStore:
+    # Parsed decks shared by every tab, reference counted and evicted least recently used first
+    # once their estimated size exceeds the memory budget
+    def __init__(self, budget_bytes=256 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.items = OrderedDict()  # Deck path -> StoreItem, least recently used first
+        self.refs = {}  # Deck path -> number of tabs holding it, kept even while the deck is evicted
+        self.size = 0
+
+    def fingerprint(self, path):
+        bundle_path, deck_name = split_bundle_path(path)
+        try:
+            return os.stat(bundle_path or path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, path, loader, check_stale=False):
+        item = self.items.get(path)
+        if item is not None and check_stale and item.mtime_ns != self.fingerprint(path):
+            self.discard(path)
+            item = None
+        if item is None:
+            mtime_ns = self.fingerprint(path)
+            entries = loader(path)
+            if entries is None:
+                return None
+            item = StoreItem(entries, mtime_ns)
+            self.items[path] = item
+            self.size += item.size
+        self.items.move_to_end(path)
+        self.evict(keep=path)
+        return item
+
+    def retain(self, path):
+        if path:
+            self.refs[path] = self.refs.get(path, 0) + 1
+
+    def release(self, path):
+        if path in self.refs:
+            self.refs[path] -= 1
+            if not self.refs[path]:
+                del self.refs[path]
+
+    def discard(self, path):
+        item = self.items.pop(path, None)
+        if item is not None:
+            self.size -= item.size
+
+    def evict(self, keep=None):
+        # Unreferenced decks go first, then decks of background tabs; the active deck is never evicted
+        while self.size > self.budget_bytes:
+            candidates = [path for path in self.items if path != keep and path not in self.refs] \
+                or [path for path in self.items if path != keep]
+            if not candidates:
+                break
+            self.discard(candidates[0])
+
+class DeckTab:
+    def __init__(self, path=None, index=0):
+        self.path = path
+        self.index = index
+
+class SkipTable:
+    # next_index/previous_index hold, for every entry, the nearest eligible entry after/before it with wrap-around,
+    # so stepping is one lookup however sparse the eligible entries are. -1 when nothing is eligible
+    def __init__(self, entries, is_eligible):
+        self.entries = entries
+        self.is_eligible = is_eligible
+        self.rebuild()
+
+    def rebuild(self):
+        count = len(self.entries)
+        self.eligible = [bool(self.is_eligible(entry)) for entry in self.entries]
+        self.eligible_count = sum(self.eligible)
+        self.next_index = [-1] * count
+        self.previous_index = [-1] * count
+        if not self.eligible_count:
+            return
+        following = self.eligible.index(True)  # Wraps past the end to the first eligible entry
+        for i in range(count - 1, -1, -1):
+            self.next_index[i] = following
+            if self.eligible[i]:
+                following = i
+        preceding = count - 1 - self.eligible[::-1].index(True)
+        for i in range(count):
+            self.previous_index[i] = preceding
+            if self.eligible[i]:
+                preceding = i
+
+    def update(self, index):
+        # Re-evaluates one entry; only the run of ineligible entries that points at it is rewritten
+        eligible = bool(self.is_eligible(self.entries[index]))
+        if eligible == self.eligible[index]:
+            return
+        self.eligible[index] = eligible
+        self.eligible_count += 1 if eligible else -1
+        if self.eligible_count < 2:
+            self.rebuild()
+            return
+        count = len(self.entries)
+        target = index if eligible else self.next_index[index]
+        i = (index - 1) % count
+        while True:
+            self.next_index[i] = target
+            if self.eligible[i]:
+                break
+            i = (i - 1) % count
+        target = index if eligible else self.previous_index[index]
+        i = (index + 1) % count
+        while True:
+            self.previous_index[i] = target
+            if self.eligible[i]:
+                break
+            i = (i + 1) % count
+
+class LayoutEngine:
+    # Applies the mode presets, and once the user has resized the window narrower than the presets
+    # need, shrinks wrap lengths and steps fonts down. Reflows at most once per frame and only
+    # reconfigures the widget options whose values changed
+    FRAME_MS = 16
+    MODES = {
+        # Font tiers index S, M, L, XL
+        "normal": {"section_font": 0, "title_font": 2, "content_font": 1, "section_height": 1, "wraplength": 950,
+                   "list": (15, 25), "text": (15, 50), "button": (10, 2)},
+        "compact": {"section_font": 0, "title_font": 1, "content_font": 0, "section_height": 1, "wraplength": 500,
+                    "list": (10, 20), "text": (10, 30), "button": (8, 1)},
+        "wide": {"section_font": 2, "title_font": 3, "content_font": 3, "section_height": 2, "wraplength": 1500,
+                 "list": (15, 25), "text": (15, 64), "button": (10, 2)},
+    }
+
+    def __init__(self, app):
+        self.app = app
+        self.applied = {}  # Widget -> options last applied by the engine
+        self.pending = None
+        self.width = 0
+        self.user_sized = False  # Set once the window stops following its requested width
+        self.natural_widths = {}  # Mode -> window width Tk chose for the mode's presets
+        app.root.bind("<Configure>", self.on_configure, add="+")
+
+    def on_configure(self, event):
+        if event.widget is not self.app.root or event.width == self.width or event.width <= 1:
+            return
+        self.width = event.width
+        # Without a user geometry the window follows its requested width, which the presets determine
+        if not self.user_sized and event.width != self.app.root.winfo_reqwidth():
+            self.user_sized = True
+        if not self.user_sized:
+            self.natural_widths[self.app.layout_mode.get()] = event.width
+            return  # The presets are already applied, reflowing could only feed back into the width
+        if self.pending is None:
+            self.pending = self.app.root.after(self.FRAME_MS, self.reflow)
+
+    def compute(self):
+        app = self.app
+        mode = self.MODES.get(app.layout_mode.get(), self.MODES["normal"])
+        title_fonts = (app.title_S_font, app.title_M_font, app.title_L_font, app.title_XL_font)
+        content_fonts = (app.context_S_font, app.context_M_font, app.context_L_font, app.context_XL_font)
+        wraplength = mode["wraplength"]
+        step = 0
+        if self.user_sized:
+            natural_width = self.natural_widths.get(app.layout_mode.get(), mode["wraplength"] + 40)
+            if self.width < natural_width:
+                wraplength = min(wraplength, max(self.width - 40, 200))
+                step = 1 if self.width >= natural_width * 2 // 3 else 2
+        tier = lambda base: max(base - step, 0)
+        button_width, button_height = mode["button"]
+        button_options = {"width": button_width, "height": button_height}
+        return {
+            app.section_label: {"wraplength": wraplength, "height": mode["section_height"], "font": title_fonts[tier(mode["section_font"])]},
+            app.title_label: {"wraplength": wraplength, "height": 3, "font": title_fonts[tier(mode["title_font"])]},
+            app.jump_listbox: {"height": mode["list"][0], "width": mode["list"][1]},
+            app.content_text: {"height": mode["text"][0], "width": mode["text"][1], "font": content_fonts[tier(mode["content_font"])]},
+            app.show_hide_button: button_options,
+            app.prev_button: button_options,
+            app.next_button: button_options,
+            app.random_button: button_options,
+        }
+
+    def reflow(self):
+        if self.pending is not None:
+            self.app.root.after_cancel(self.pending)
+            self.pending = None
+        for widget, options in self.compute().items():
+            applied = self.applied.setdefault(widget, {})
+            changed = {name: value for name, value in options.items() if applied.get(name) != value}
+            if changed:
+                widget.config(**changed)
+                applied.update(changed)
+
 class MemoHelperApp:
     def __init__(self, root, entries):
         self.root = root
@@ -143,6 +991,23 @@ class MemoHelperApp:
         self.text_font_family = tk.StringVar(value="SimSun")
         self.title_bold = tk.BooleanVar(value=False)
         self.text_bold = tk.BooleanVar(value=False)
+        self.use_library = tk.BooleanVar(value=False)  # Load decks through the SQLite library
+        self.library = None
+        self.fast_parse = tk.BooleanVar(value=True)  # Parse raw bytes instead of decoded lines
+        self.file_patterns = ["N*.md"]  # Glob patterns for files listed from the content folder
+        self.include_subfolders = tk.BooleanVar(value=True)
+        self.folder_index = None
+        self.missing_recent_files = set()
+        self.image_cache = ImageCache()
+        self.image_paths = {}  # Deck path -> {image url: resolved file path or None}
+        self.review_history = ReviewHistory()
+        self.bundles = {}  # Bundle path -> open DeckBundle
+        self.deck_store = DeckStore()
+        self.tabs = [DeckTab()]
+        self.active_tab = self.tabs[0]
+        self.eligible_min_length = 0  # Plain copy of min_content_length, read once per entry without a Tcl call
+        self.skip_table = SkipTable(self.entries, self.is_eligible)
+        self.min_content_length.trace_add("write", self.on_eligibility_changed)
 
         self.config = load_config()
         self.recent_files = self.config.get("recent_files", [])
@@ -157,6 +1022,8 @@ class MemoHelperApp:
         self.context_M_font = tkfont.Font(family="SimSun", size=14, weight="normal")
         self.context_S_font = tkfont.Font(family="SimSun", size=10, weight="normal")
 
+        self.tab_frame = tk.Frame(root)  # Packed above section_label once a second tab is open
+
         self.section_label = tk.Label(root, text="", font=self.title_S_font, wraplength=800, height=1)
         self.section_label.pack(pady=(15, 0))
 
@@ -169,6 +1036,7 @@ class MemoHelperApp:
         
         self.content_text = tk.Text(self.content_frame, wrap=tk.WORD, height=15, width=50, font=self.context_M_font)
         self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 10), pady=(10, 0))  # Adjust padding
+        self.content_renderer = ContentRenderer(self.content_text, image_loader=self.load_entry_image)
 
         self.list_frame = tk.Frame(self.content_frame)
         self.list_frame.pack(side=tk.LEFT, padx=10, pady=(10, 0), fill=tk.Y)  # Adjust padding
@@ -198,6 +1066,8 @@ class MemoHelperApp:
         self.next_button = tk.Button(self.button_frame, text="▶", command=self.show_next, **button_options)
         self.next_button.pack(side=tk.LEFT, padx=5)
 
+        self.layout_engine = LayoutEngine(self)
+
         self.create_menu()
         
         self.themes = {
@@ -234,6 +1104,7 @@ class MemoHelperApp:
         theme = self.themes.get(theme_name, self.themes["default"])
         theme.apply(self)
         self.current_theme.set(theme_name)
+        self.update_tab_bar()
 
     def apply_config(self):
         # ...existing code...
@@ -252,6 +1123,11 @@ class MemoHelperApp:
         self.text_font_family.set(self.config.get("text_font_family", "Times New Roman"))
         self.title_bold.set(self.config.get("title_bold", False))
         self.text_bold.set(self.config.get("text_bold", False))
+        self.use_library.set(self.config.get("use_library", False))
+        self.fast_parse.set(self.config.get("fast_parse", True))
+        self.deck_store.budget_bytes = self.config.get("deck_memory_budget_mb", 256) * 1024 * 1024
+        self.file_patterns = self.config.get("file_patterns", ["N*.md"])
+        self.include_subfolders.set(self.config.get("include_subfolders", True))
         self.update_fonts()
         if self.layout_mode.get() == "compact":
             self.set_compact_mode()
@@ -265,6 +1141,12 @@ class MemoHelperApp:
         self.apply_mouse_interaction()  # Apply mouse interaction setting
         
     def late_apply_config(self):
+        # Background tabs are restored without loading; their decks are read when first selected
+        for path in self.config.get("open_tabs", []):
+            if path != self.active_tab.path and deck_file_exists(path):
+                self.tabs.append(DeckTab(path))
+                self.deck_store.retain(path)
+        self.update_tab_bar()
         self.index = (self.config.get("last_opened_entry", 0))
         if self.index > 0 and self.index < len(self.entries):
             self.show_entry()
@@ -290,19 +1172,31 @@ class MemoHelperApp:
         self.config["text_font_family"] = self.text_font_family.get()
         self.config["title_bold"] = self.title_bold.get()
         self.config["text_bold"] = self.text_bold.get()
+        self.config["use_library"] = self.use_library.get()
+        self.config["fast_parse"] = self.fast_parse.get()
+        self.config["deck_memory_budget_mb"] = self.deck_store.budget_bytes // (1024 * 1024)
+        self.config["open_tabs"] = [tab.path for tab in self.tabs if tab.path and tab is not self.active_tab]
+        self.config["file_patterns"] = self.file_patterns
+        self.config["include_subfolders"] = self.include_subfolders.get()
         self.config["custom_themes"] = {name: theme.__dict__ for name, theme in self.custom_themes.items()}
         save_config(self.config)
 
     def try_open_default_file(self):
-        if self.last_opened_file and os.path.exists(self.last_opened_file):
-            self.load_selected_file_from_menu(os.path.basename(self.last_opened_file))
+        if self.last_opened_file and deck_file_exists(self.last_opened_file):
+            self.load_selected_file(self.last_opened_file)
             self.show_entry()
         else:
-            files = [f for f in os.listdir(self.content_folder) if f.startswith('N') and f.endswith('.md')]
-            if files:
-                self.load_selected_file_from_menu(files[0])
-            else:
-                self.show_guide()  # Show guide when no file is loaded
+            index = self.get_folder_index()
+
+            def open_first_file(files):
+                if self.active_tab.path or index is not self.folder_index:
+                    return  # The user opened a deck or changed folders while the folder was scanned
+                if files:
+                    self.load_selected_file_from_menu(files[0])
+                else:
+                    self.show_guide()  # Show guide when no file is loaded
+
+            self.run_in_background(index.refresh, open_first_file)
 
     def create_menu(self):
         menu_bar = Menu(self.root)
@@ -315,22 +1209,36 @@ class MemoHelperApp:
         file_submenu = Menu(file_menu, tearoff=0)
         self.file_submenu = file_submenu
         self.file_menu.add_command(label="Open File...", command=self.open_file)
+        self.file_menu.add_command(label="Open in New Tab...", command=self.new_tab)
+        self.file_menu.add_command(label="Close Tab", command=self.close_tab)
         self.recent_files_menu = Menu(self.file_menu, tearoff=0)
         self.file_menu.add_cascade(label="Recent Files", menu=self.recent_files_menu)
         
         file_menu.add_separator()
 
         self.file_menu.add_command(label="File Folder...", command=self.set_file_folder)
+        self.file_menu.add_command(label="File Patterns...", command=self.set_file_patterns)
+        self.file_menu.add_command(label="Save Folder as Bundle...", command=self.save_folder_as_bundle)
+        self.file_menu.add_checkbutton(label="Include Subfolders", variable=self.include_subfolders, command=self.load_files)
         self.load_files()
         file_menu.add_cascade(label="Select File in Folder", menu=file_submenu)
         
         self.update_recent_files_menu()
 
+        file_menu.add_separator()
+        library_menu = Menu(file_menu, tearoff=0)
+        file_menu.add_cascade(label="Library", menu=library_menu)
+        library_menu.add_checkbutton(label="Load Decks from Library", variable=self.use_library)
+        library_menu.add_command(label="Add Folder to Library...", command=self.add_folder_to_library)
+        library_menu.add_command(label="Search Library...", command=self.search_library)
+        file_menu.add_command(label="Find Near-Duplicates in Folder", command=self.find_duplicates_in_folder)
+
         edit_menu = Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Edit", menu=edit_menu, )
         
         self.always_show_checkbutton = edit_menu.add_checkbutton(label="Always Show Content", variable=self.always_show)
         edit_menu.add_checkbutton(label="Enable Mouse Interaction", variable=self.mouse_interaction_enabled, command=self.apply_mouse_interaction)
+        edit_menu.add_checkbutton(label="Fast Byte Parser", variable=self.fast_parse)
         
         edit_menu.add_separator()
         edit_menu.add_command(label=f"Set Min Content Length", command=self.set_min_content_length)  # Add menu item for setting min content length
@@ -389,6 +1297,7 @@ class MemoHelperApp:
         
         view_menu.add_separator()
         view_menu.add_checkbutton(label="Sticky on Top", variable=self.always_on_top, command=self.toggle_always_on_top)
+        view_menu.add_command(label="Review Dashboard", command=self.show_review_dashboard)
 
         help_menu = Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Help", menu=help_menu)
@@ -405,7 +1314,8 @@ class MemoHelperApp:
             "4. Toggle content visibility with the 'Show'/'Hide' button.\n"
             "5. Customize the appearance using the 'View' menu.\n"
             "6. Search selected text on the web using the context menu.\n"
-            "7. Save your settings using the 'Save Config' option in the 'File' menu.\n\n"
+            "7. Save your settings using the 'Save Config' option in the 'File' menu.\n"
+            "8. Press '1' (forgot) or '2' (remembered) to grade an entry; see 'View' > 'Review Dashboard'.\n\n"
             "Your content in .md files should be like:\n"
             "# My Note\n"
             "### Chapter 1 - Overview\n"
@@ -421,7 +1331,8 @@ class MemoHelperApp:
             "4. 使用“显示”/“隐藏”按钮切换内容可见性。\n"
             "5. 使用“视图”菜单自定义外观。\n"
             "6. 使用右键菜单在 Web 上搜索选定的文本。\n"
-            "7. 使用“文件”菜单中的“保存配置”选项保存您的设置。\n\n"
+            "7. 使用“文件”菜单中的“保存配置”选项保存您的设置。\n"
+            "8. 按“1”（忘记）或“2”（记得）为条目评分，在“视图”>“复习统计”中查看。\n\n"
             "加载的 .md 文件内容应该为如下格式：\n"
             "# 我的笔记\n"
             "### 第一章：概述\n"
@@ -463,15 +1374,8 @@ class MemoHelperApp:
         if self.visibility_mode.get() != "hide_list":
             self.list_frame.pack(side=tk.LEFT, padx=10, pady=(10, 0), fill=tk.Y)
         self.button_frame.pack(pady=10)
-        self.section_label.config(wraplength=950, height=1, font=self.title_S_font)
-        self.title_label.config(wraplength=1000, height=3, font=self.title_L_font)
-        self.jump_listbox.config(height=15, width=25)
-        self.content_text.config(height=15, width=50, font=self.context_M_font)
-        self.show_hide_button.config(width=10, height=2)
-        self.prev_button.config(width=10, height=2)
-        self.next_button.config(width=10, height=2)
-        self.random_button.config(width=10, height=2)
         self.layout_mode.set("normal")
+        self.layout_engine.reflow()  # Sizes and fonts come from LayoutEngine.MODES
         self.apply_mouse_interaction()  # Apply mouse interaction setting
 
     def set_compact_mode(self):
@@ -479,15 +1383,8 @@ class MemoHelperApp:
         if self.visibility_mode.get() != "hide_list":
             self.list_frame.pack(side=tk.LEFT, padx=10, pady=(10, 0), fill=tk.Y)
         self.button_frame.pack(pady=10)
-        self.section_label.config(wraplength=500, height=1, font=self.title_S_font)
-        self.title_label.config(wraplength=500, height=3, font=self.title_M_font)
-        self.jump_listbox.config(height=10, width=20)
-        self.content_text.config(height=10, width=30, font=self.context_S_font)
-        self.show_hide_button.config(width=8, height=1)
-        self.prev_button.config(width=8, height=1)
-        self.next_button.config(width=8, height=1)
-        self.random_button.config(width=8, height=1)
         self.layout_mode.set("compact")
+        self.layout_engine.reflow()  # Sizes and fonts come from LayoutEngine.MODES
         self.apply_mouse_interaction()  # Apply mouse interaction setting
 
     def set_wide_mode(self):
@@ -495,12 +1392,8 @@ class MemoHelperApp:
         if self.visibility_mode.get() != "hide_list":
             self.list_frame.pack(side=tk.LEFT, padx=10, pady=(10, 0), fill=tk.Y)
         self.button_frame.pack(pady=10)
-        # Adjust section_label and title_label
-        self.section_label.config(wraplength=1500, height=2, font=self.title_L_font)
-        self.title_label.config(wraplength=1500, height=3, font=self.title_XL_font)
-        # Adjust content_text
-        self.content_text.config(height=15, width=64, font=self.context_XL_font)
         self.layout_mode.set("wide")
+        self.layout_engine.reflow()  # Sizes and fonts come from LayoutEngine.MODES
         self.apply_mouse_interaction()  # Apply mouse interaction setting
 
     def toggle_list_visibility(self):
@@ -532,44 +1425,314 @@ class MemoHelperApp:
         self.root.bind('<space>', lambda event: self.toggle_content())
         self.root.bind('<Down>', lambda event: self.toggle_content())
         self.root.bind('<s>', lambda event: self.toggle_content())
+        self.root.bind('<Key-1>', lambda event: self.grade_entry(0))
+        self.root.bind('<Key-2>', lambda event: self.grade_entry(1))
+        self.root.bind('<Control-Tab>', lambda event: self.cycle_tab(1))
+        self.root.bind('<Control-Shift-Tab>', lambda event: self.cycle_tab(-1))
+
+    def get_folder_index(self):
+        index = self.folder_index
+        if (index is None or index.root != os.path.abspath(self.content_folder)
+                or index.patterns != tuple(self.file_patterns) or index.recursive != self.include_subfolders.get()):
+            index = FolderIndex(self.content_folder, self.file_patterns, self.include_subfolders.get())
+            self.folder_index = index
+        return index
 
     def load_files(self):
+        # Show the cached listing right away and refresh it off the UI thread
+        index = self.get_folder_index()
+        self.populate_file_submenu(index.paths)
+
+        def on_refreshed(files):
+            if index is self.folder_index:  # A scan of a previous folder may finish after the current one
+                self.populate_file_submenu(files)
+
+        self.run_in_background(index.refresh, on_refreshed)
+
+    def populate_file_submenu(self, files):
         self.file_submenu.delete(0, tk.END)
-        files = [f for f in os.listdir(self.content_folder) if f.startswith('N') and f.endswith('.md')]
         for file in files:
             self.file_submenu.add_command(label=file, command=lambda f=file: self.load_selected_file_from_menu(f))
 
+    def set_file_patterns(self):
+        patterns = simpledialog.askstring("File Patterns", "Glob patterns separated by spaces:",
+                                          initialvalue=" ".join(self.file_patterns), parent=self.root)
+        if patterns and patterns.split():
+            self.file_patterns = patterns.split()
+            self.load_files()
+            self.save_current_config()
+
     def load_selected_file_from_menu(self, file_name):
-        try:
-            file_path = os.path.join(self.content_folder, file_name)
-            lines = read_file(file_path)
-            if lines:
-                self.entries = parse_entries(lines)
-                self.index = 0
-                self.show_entry()
-                self.jump_listbox.delete(0, tk.END)
-                for i, entry in enumerate(self.entries):
-                    title = entry.title if entry.title else entry.content
-                    self.jump_listbox.insert(tk.END, f"{i+1}. {title}")
-                self.last_opened_file = file_path
-        except IndexError:
-            messagebox.showerror("Error", "Please select a valid file.")
+        self.load_selected_file(os.path.join(self.content_folder, file_name))
 
     def load_selected_file(self, file_path):
+        # Opens the deck in the active tab, reusing the shared store unless the file changed on disk
         try:
-            lines = read_file(file_path)
-            if lines:
-                self.entries = parse_entries(lines)
-                self.index = 0
-                self.show_entry()
-                self.jump_listbox.delete(0, tk.END)
-                for i, entry in enumerate(self.entries):
-                    title = entry.title if entry.title else entry.content
-                    self.jump_listbox.insert(tk.END, f"{i+1}. {title}")
-                self.last_opened_file = file_path
+            item = self.deck_store.get(file_path, self.read_entries, check_stale=True)
+            if item is not None:
+                if self.active_tab.path != file_path:
+                    self.deck_store.release(self.active_tab.path)
+                    self.deck_store.retain(file_path)
+                    self.active_tab.path = file_path
+                self.activate_deck(item, 0)
+                self.update_tab_bar()
         except IndexError:
             messagebox.showerror("Error", "Please select a valid file.")
 
+    def activate_deck(self, item, index):
+        self.last_opened_file = self.active_tab.path
+        self.entries = item.entries
+        self.index = index
+        self.jump_listbox.delete(0, tk.END)
+        self.jump_listbox.insert(tk.END, *item.jump_labels())
+        self.get_skip_table()
+        self.show_entry()
+
+    def new_tab(self, file_path=None):
+        if file_path is None:
+            self.open_file(open_deck=self.new_tab)  # Calls back with the chosen deck, also inside bundles
+            return
+        previous_tab = self.active_tab
+        previous_tab.index = self.index
+        self.active_tab = DeckTab()
+        self.tabs.append(self.active_tab)
+        self.load_selected_file(file_path)
+        if self.active_tab.path is None:  # Loading failed, keep the previous tab
+            self.tabs.remove(self.active_tab)
+            self.active_tab = previous_tab
+        else:
+            self.add_to_recent_files(file_path)
+        self.update_tab_bar()
+
+    def switch_tab(self, tab):
+        if tab is self.active_tab:
+            return
+        item = self.deck_store.get(tab.path, self.read_entries) if tab.path else None
+        if item is None:
+            return
+        self.active_tab.index = self.index
+        self.active_tab = tab
+        self.activate_deck(item, min(tab.index, len(item.entries) - 1))
+        self.update_tab_bar()
+
+    def cycle_tab(self, step=1):
+        if len(self.tabs) > 1:
+            self.switch_tab(self.tabs[(self.tabs.index(self.active_tab) + step) % len(self.tabs)])
+
+    def close_tab(self, tab=None):
+        tab = tab or self.active_tab
+        if len(self.tabs) < 2:
+            return
+        if tab is self.active_tab:
+            position = self.tabs.index(tab)
+            self.switch_tab(self.tabs[position + 1] if position + 1 < len(self.tabs) else self.tabs[position - 1])
+            if self.active_tab is tab:  # The neighbouring deck failed to load, keep this tab open
+                return
+        self.tabs.remove(tab)
+        self.deck_store.release(tab.path)
+        self.update_tab_bar()
+
+    def update_tab_bar(self):
+        for child in self.tab_frame.winfo_children():
+            child.destroy()
+        if len(self.tabs) < 2:
+            self.tab_frame.pack_forget()
+            return
+        theme = self.themes.get(self.current_theme.get(), self.themes["default"])
+        self.tab_frame.config(bg=theme.bg)
+        self.tab_frame.pack(before=self.section_label, fill=tk.X, padx=10, pady=(5, 0))
+        for tab in self.tabs:
+            bundle_path, deck_name = split_bundle_path(tab.path)
+            label = os.path.basename(deck_name or tab.path or "Untitled")
+            active = tab is self.active_tab
+            tk.Button(self.tab_frame, text=label, relief=tk.SUNKEN if active else tk.RAISED, bg=theme.bg, fg=theme.fg,
+                      command=lambda t=tab: self.switch_tab(t)).pack(side=tk.LEFT)
+            tk.Button(self.tab_frame, text="×", bg=theme.bg, fg=theme.fg,
+                      command=lambda t=tab: self.close_tab(t)).pack(side=tk.LEFT, padx=(0, 5))
+
+    def read_entries(self, file_path):
+        bundle_path, deck_name = split_bundle_path(file_path)
+        if bundle_path:
+            try:
+                return self.get_bundle(bundle_path).load_entries(deck_name) or None
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                messagebox.showerror("Error", f"Cannot open deck: {file_path}")
+                return None
+        if self.use_library.get():
+            try:
+                return self.get_library().load_entries(file_path) or None
+            except OSError:
+                messagebox.showerror("Error", f"File not found: {file_path}")
+                return None
+        if self.fast_parse.get():
+            try:
+                return parse_file(file_path) or None
+            except FileNotFoundError:
+                messagebox.showerror("Error", f"File not found: {file_path}")
+                return None
+        lines = read_file(file_path)
+        return parse_entries(lines) if lines else None
+
+    def get_bundle(self, bundle_path):
+        bundle_path = os.path.abspath(bundle_path)
+        bundle = self.bundles.get(bundle_path)
+        if bundle is None or bundle.mtime_ns != os.stat(bundle_path).st_mtime_ns:
+            if bundle is not None:
+                bundle.close()
+            bundle = DeckBundle(bundle_path)
+            self.bundles[bundle_path] = bundle
+        return bundle
+
+    def open_bundle(self, bundle_path, open_deck=None):
+        open_deck = open_deck or self.open_deck
+        try:
+            deck_names = self.get_bundle(bundle_path).deck_names()
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            messagebox.showerror("Error", f"Not a valid deck bundle: {bundle_path}")
+            return
+        if len(deck_names) == 1:
+            open_deck(f"{bundle_path}{BUNDLE_SEPARATOR}{deck_names[0]}")
+            return
+
+        def open_selected(event=None):
+            selection = deck_listbox.curselection()
+            if selection:
+                dialog.destroy()
+                open_deck(f"{bundle_path}{BUNDLE_SEPARATOR}{deck_names[selection[0]]}")
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(os.path.basename(bundle_path))
+        deck_listbox = tk.Listbox(dialog, width=60, height=15)
+        deck_listbox.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        for deck_name in deck_names:
+            deck_listbox.insert(tk.END, deck_name)
+        deck_listbox.bind("<Double-Button-1>", open_selected)
+        tk.Button(dialog, text="Open", command=open_selected).pack(pady=10)
+
+    def open_deck(self, file_path):
+        self.load_selected_file(file_path)
+        self.add_to_recent_files(file_path)
+
+    def save_folder_as_bundle(self):
+        output_path = filedialog.asksaveasfilename(defaultextension=BUNDLE_EXTENSION, filetypes=[("Memorax bundles", "*" + BUNDLE_EXTENSION)])
+        if output_path:
+            self.run_in_background(lambda: build_bundle(self.content_folder, output_path, self.file_patterns),
+                                   lambda toc: messagebox.showinfo("Info", f"Bundled {len(toc['decks'])} deck(s) and {len(toc['assets'])} asset(s)."))
+
+    def get_library(self):
+        if self.library is None:
+            self.library = DeckLibrary()
+        return self.library
+
+    def run_in_background(self, work, on_done):
+        # Run work on a worker thread and hand its result back on the Tk thread
+        result = {}
+
+        def worker():
+            try:
+                result["value"] = work()
+            except Exception as error:
+                result["error"] = error
+
+        def poll():
+            if thread.is_alive():
+                self.root.after(50, poll)
+            elif "error" in result:
+                messagebox.showerror("Error", str(result["error"]))
+            else:
+                on_done(result.get("value"))
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        self.root.after(50, poll)
+
+    def add_folder_to_library(self):
+        folder_selected = filedialog.askdirectory()
+        if not folder_selected:
+            return
+
+        def ingest():
+            library = DeckLibrary(self.get_library().db_path)  # Worker threads use their own connection
+            try:
+                return library.ingest_folder(folder_selected)
+            finally:
+                library.close()
+
+        self.run_in_background(ingest, lambda updated: messagebox.showinfo("Info", f"Library updated: {updated} file(s) indexed."))
+
+    def search_library(self):
+        def run_search(event=None):
+            results_listbox.delete(0, tk.END)
+            results.clear()
+            results.extend(self.get_library().search(query_entry.get()))
+            for path, position, title, content in results:
+                text = title if title else content
+                results_listbox.insert(tk.END, f"{os.path.basename(path)} #{position + 1}: {text.replace(chr(10), ' ')}")
+
+        def open_result(event=None):
+            selection = results_listbox.curselection()
+            if selection:
+                self.open_entry(*results[selection[0]][:2])
+
+        results = []
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Search Library")
+        query_entry = tk.Entry(dialog, width=50)
+        query_entry.pack(padx=10, pady=10, fill=tk.X)
+        query_entry.bind("<Return>", run_search)
+        results_listbox = tk.Listbox(dialog, width=80, height=20)
+        results_listbox.pack(padx=10, fill=tk.BOTH, expand=True)
+        results_listbox.bind("<Double-Button-1>", open_result)
+        tk.Button(dialog, text="Search", command=run_search).pack(pady=10)
+        query_entry.focus_set()
+
+    def open_entry(self, file_path, index):
+        if os.path.abspath(file_path) != os.path.abspath(self.last_opened_file or ""):
+            self.load_selected_file(file_path)
+        if 0 <= index < len(self.entries):
+            self.index = index
+            self.show_entry()
+
+    def find_duplicates_in_folder(self):
+        index = self.get_folder_index()
+
+        def analyse():
+            decks = []
+            for path in [os.path.join(index.root, f) for f in index.refresh()]:
+                try:
+                    decks.append((path, parse_file(path)))
+                except OSError:
+                    continue
+            return find_near_duplicates(decks), {path: entries for path, entries in decks}
+
+        self.run_in_background(analyse, lambda result: self.show_duplicates_report(*result))
+
+    def show_duplicates_report(self, duplicates, decks):
+        def describe(key):
+            path, index = key
+            entry = decks[path][index]
+            text = (entry.title if entry.title else entry.content).replace('\n', ' ')
+            return f"{os.path.basename(path)} #{index + 1} {text}"
+
+        def open_selected(side):
+            selection = report_listbox.curselection()
+            if selection and selection[0] < len(duplicates):
+                self.open_entry(*duplicates[selection[0]][side])
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Near-Duplicates ({len(duplicates)} pairs)")
+        report_listbox = tk.Listbox(dialog, width=120, height=25)
+        report_listbox.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        for similarity, first, second in duplicates:
+            report_listbox.insert(tk.END, f"{similarity:.0%}  {describe(first)}  ↔  {describe(second)}")
+        report_listbox.bind("<Double-Button-1>", lambda event: open_selected(1))
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Open First", command=lambda: open_selected(1)).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Open Second", command=lambda: open_selected(2)).pack(side=tk.LEFT, padx=5)
+        if not duplicates:
+            report_listbox.insert(tk.END, "No near-duplicate entries found.")
+
     def handle_click(self, event):
         if (event.widget == self.root):
             if event.x < self.root.winfo_width() // 2:
@@ -583,7 +1746,7 @@ class MemoHelperApp:
         entry = self.entries[self.index]
         title = entry.title.replace('\n', ' ') if entry.title else entry.content.replace('\n', ' ')
         self.title_label.config(text=title if title else entry.content)
-        self.content_text.delete(1.0, tk.END)
+        self.content_renderer.hide()
         self.showing_content = False
         self.jump_listbox.selection_clear(0, tk.END)
         self.jump_listbox.selection_set(self.index)
@@ -593,13 +1756,12 @@ class MemoHelperApp:
         if entry.title == entry.content or not entry.content or self.always_show.get():
             if not entry.content:
                 entry.content = "No Content"
-            self.content_text.insert(tk.END, entry.content)
+                self.get_skip_table().update(self.index)
+            self.render_content(entry)
             self.showing_content = True
             self.show_hide_button.config(text="Hide")
         else:
-            # Ensure proper alignment for entries without title
-            self.title_label.config(height=3)
-            self.show_hide_button.config(text="Show")
+            self.show_hide_button.config(text="Show")  # The layout engine keeps title_label at height 3
 
         # Update section label
         if entry.section_titles:
@@ -609,14 +1771,77 @@ class MemoHelperApp:
             self.root.title("Memorax")
             section_title = ""
         self.section_label.config(text=section_title)
+        self.prefetch_images()
 
     def display_content(self):
-        entry = self.entries[self.index]
-        content = entry.content if entry.content else "No Content"
-        self.content_text.insert(tk.END, content)
+        self.render_content(self.entries[self.index])
         self.showing_content = True
         self.show_hide_button.config(text="Hide")
 
+    def render_content(self, entry):
+        if entry.content and entry.display_content:
+            self.content_renderer.show(entry.display_content, entry.inline_runs, entry.links)
+        else:
+            self.content_renderer.show(entry.content if entry.content else "No Content")
+
+    def image_max_width(self):
+        return max(self.content_text.winfo_width() - 20, 200)
+
+    def image_resolver(self):
+        # Relative urls resolve against the deck's folder, or are extracted from the deck's bundle
+        bundle_path, deck_name = split_bundle_path(self.last_opened_file)
+        if bundle_path:
+            bundle = self.get_bundle(bundle_path)
+            return lambda url: bundle.extract_asset(deck_name, url)
+        deck_folder = os.path.dirname(self.last_opened_file) if self.last_opened_file else self.content_folder
+        return lambda url: resolve_image_path(deck_folder, url)
+
+    def resolve_image(self, url):
+        # Resolved paths are cached per deck
+        deck_paths = self.image_paths.setdefault(self.last_opened_file or "", {})
+        if url not in deck_paths:
+            deck_paths[url] = self.image_resolver()(url)
+        return deck_paths[url]
+
+    def load_entry_image(self, url):
+        path = self.resolve_image(url)
+        return self.image_cache.decode(path, self.image_max_width()) if path else None
+
+    def prefetch_images(self):
+        # Read the images of the neighbouring entries on a worker thread, then decode them when idle
+        if not self.entries:
+            return
+        urls = []
+        for index in (self.neighbour_index(1), self.neighbour_index(-1)):
+            entry = self.entries[index]
+            url_runs = [run for run in entry.inline_runs if run[2] in ("image", "link")]
+            urls.extend(url for run, url in zip(url_runs, entry.links) if run[2] == "image")
+        if not urls:
+            return
+        deck_paths = self.image_paths.setdefault(self.last_opened_file or "", {})
+        resolve = self.image_resolver()
+        max_width = self.image_max_width()
+
+        def read_images():
+            images = []
+            for url in urls:
+                if url not in deck_paths:
+                    deck_paths[url] = resolve(url)
+                path = deck_paths[url]
+                if path and (path, max_width) not in self.image_cache:
+                    try:
+                        with open(path, 'rb') as file:
+                            images.append((path, base64.b64encode(file.read())))
+                    except OSError:
+                        continue
+            return images
+
+        def decode_images(images):
+            for path, data in images:
+                self.root.after_idle(self.image_cache.decode, path, max_width, data)
+
+        self.run_in_background(read_images, decode_images)
+
     def toggle_content(self):
         if self.showing_content:
             self.hide_content()
@@ -625,16 +1850,39 @@ class MemoHelperApp:
             self.display_content()
             self.show_hide_button.config(text="Hide")
 
+    def is_eligible(self, entry):
+        # Sequential and random navigation skip entries failing this rule
+        return len(entry.content or "") >= self.eligible_min_length
+
+    def on_eligibility_changed(self, *args):
+        self.eligible_min_length = self.min_content_length.get()
+        self.skip_table.rebuild()
+
+    def get_skip_table(self):
+        if self.skip_table.entries is not self.entries:
+            self.skip_table = SkipTable(self.entries, self.is_eligible)
+        return self.skip_table
+
+    def neighbour_index(self, step):
+        # The entry show_next (step 1) or show_previous (step -1) moves to
+        skip_table = self.get_skip_table()
+        index = (skip_table.next_index if step > 0 else skip_table.previous_index)[self.index]
+        return index if index >= 0 else (self.index + step) % len(self.entries)  # Nothing eligible, step anyway
+
     def show_next(self):
-        self.index = (self.index + 1) % len(self.entries)
+        if not self.entries:
+            return
+        self.index = self.neighbour_index(1)
         self.show_entry()
 
     def show_previous(self):
-        self.index = (self.index - 1) % len(self.entries)
+        if not self.entries:
+            return
+        self.index = self.neighbour_index(-1)
         self.show_entry()
 
     def hide_content(self, event=None):
-        self.content_text.delete(1.0, tk.END)
+        self.content_renderer.hide()
         self.showing_content = False
         self.show_hide_button.config(text="Show")
 
@@ -647,13 +1895,75 @@ class MemoHelperApp:
             messagebox.showerror("Error", "Please select a valid entry.")
 
     def show_random_entry(self):
-        valid_entries = [i for i, entry in enumerate(self.entries) if len(entry.content) >= self.min_content_length.get()]
+        valid_entries = [i for i, eligible in enumerate(self.get_skip_table().eligible) if eligible]
         if valid_entries:
             self.index = random.choice(valid_entries)
             self.show_entry()
         else:
             messagebox.showinfo("Info", f"No entries with content longer than {self.min_content_length.get()} characters.")
 
+    def grade_entry(self, grade):
+        if not self.entries or not self.last_opened_file:
+            return
+        self.review_history.record(self.last_opened_file, self.index, self.entries[self.index], grade)
+        self.show_next()
+
+    def show_review_dashboard(self):
+        if np is None:
+            messagebox.showerror("Error", "The review dashboard requires NumPy (pip install numpy).")
+            return
+
+        def recompute():
+            started = time.perf_counter()
+            self.run_in_background(lambda: compute_review_analytics(self.review_history.load()),
+                                   lambda analytics: draw(analytics, time.perf_counter() - started))
+
+        def draw_bars(canvas, values, labels, title, fmt):
+            canvas.delete("all")
+            width, height = int(canvas.cget("width")), int(canvas.cget("height"))
+            canvas.create_text(10, 10, anchor=tk.NW, text=title)
+            top = max(float(values.max()) if len(values) else 0.0, 1e-9)
+            bar_width = (width - 20) / max(len(values), 1)
+            for i, value in enumerate(values):
+                x = 10 + i * bar_width
+                bar_height = (height - 60) * float(value) / top
+                canvas.create_rectangle(x + 2, height - 25 - bar_height, x + bar_width - 2, height - 25, fill="#4A90D9", outline="")
+                canvas.create_text(x + bar_width / 2, height - 25 - bar_height - 8, text=fmt(value), font=self.title_S_font)
+                canvas.create_text(x + bar_width / 2, height - 12, text=labels[i], font=self.title_S_font)
+
+        def draw(analytics, elapsed):
+            if not dialog.winfo_exists():
+                return
+            summary_label.config(text=f"{analytics['events']} reviews, {analytics['accuracy']:.0%} remembered, "
+                                      f"{analytics['overdue']} overdue (computed in {elapsed:.2f}s)")
+            bin_counts, retention = analytics["retention"]
+            labels = [f"<{int(edge)}d" if np.isfinite(edge) else "1y+" for edge in RETENTION_BINS[1:]]
+            draw_bars(retention_canvas, retention, labels, "Retention by days since last review", lambda value: f"{value:.0%}")
+            forecast = analytics["forecast"]
+            draw_bars(forecast_canvas, forecast, [str(day) if day % 5 == 0 else "" for day in range(len(forecast))],
+                      "Reviews due over the next 30 days", lambda value: str(int(value)) if value else "")
+            decks, sections, counts, accuracy = analytics["sections"]
+            names = self.review_history.names
+            section_listbox.delete(0, tk.END)
+            for i in np.argsort(accuracy)[:200]:
+                deck_name = names["decks"].get(str(decks[i]), "?")
+                section_name = names["sections"].get(str(sections[i]), "?")
+                section_listbox.insert(tk.END, f"{accuracy[i]:.0%}  ({counts[i]})  {deck_name}: {section_name}")
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Review Dashboard")
+        summary_label = tk.Label(dialog, text="Computing...")
+        summary_label.pack(pady=10)
+        retention_canvas = tk.Canvas(dialog, width=700, height=200, bg="white")
+        retention_canvas.pack(padx=10)
+        forecast_canvas = tk.Canvas(dialog, width=700, height=200, bg="white")
+        forecast_canvas.pack(padx=10, pady=10)
+        tk.Label(dialog, text="Sections by accuracy").pack()
+        section_listbox = tk.Listbox(dialog, width=90, height=10)
+        section_listbox.pack(padx=10, fill=tk.BOTH, expand=True)
+        tk.Button(dialog, text="Recompute", command=recompute).pack(pady=10)
+        recompute()
+
     def toggle_always_on_top(self):
         self.root.attributes("-topmost", self.always_on_top.get())
 
@@ -703,11 +2013,16 @@ class MemoHelperApp:
             self.load_files()
         self.save_current_config()
 
-    def open_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Markdown files", "*.md")])
-        if file_path:
-            self.load_selected_file(file_path)
-            self.add_to_recent_files(file_path)
+    def open_file(self, open_deck=None):
+        # open_deck receives the chosen deck path, by default it replaces the deck of the active tab
+        open_deck = open_deck or self.open_deck
+        file_path = filedialog.askopenfilename(filetypes=[("Markdown files", "*.md"), ("Memorax bundles", "*" + BUNDLE_EXTENSION)])
+        if not file_path:
+            return
+        if file_path.endswith(BUNDLE_EXTENSION):
+            self.open_bundle(file_path, open_deck)
+        else:
+            open_deck(file_path)
 
     def add_to_recent_files(self, file_path):
         if file_path in self.recent_files:
@@ -717,11 +2032,20 @@ class MemoHelperApp:
         self.update_recent_files_menu()
         self.save_current_config()
 
-    def update_recent_files_menu(self):
+    def update_recent_files_menu(self, check_exists=True):
         self.recent_files_menu.delete(0, tk.END)
         for file_path in self.recent_files:
-            if os.path.exists(file_path):
+            if file_path not in self.missing_recent_files:
                 self.recent_files_menu.add_command(label=file_path, command=lambda fp=file_path: self.load_selected_file(fp))
+        if check_exists:
+            # Existence checks can block on network drives, so run them off the UI thread
+            recent_files = list(self.recent_files)
+            self.run_in_background(lambda: {fp for fp in recent_files if not deck_file_exists(fp)}, self.on_recent_files_checked)
+
+    def on_recent_files_checked(self, missing_files):
+        if missing_files != self.missing_recent_files:
+            self.missing_recent_files = missing_files
+            self.update_recent_files_menu(check_exists=False)
 
     def set_min_content_length(self):
         def save_length():
@@ -735,8 +2059,8 @@ class MemoHelperApp:
                 messagebox.showerror("Error", "Please enter a valid number.")
 
         dialog = tk.Toplevel(self.root)
-        dialog.title(f"Set Random Content Min Length")
-        tk.Label(dialog, text="Min content length for random entries").pack(pady=10)
+        dialog.title(f"Set Content Min Length")
+        tk.Label(dialog, text="Min content length for random and sequential entries").pack(pady=10)
         entry = tk.Entry(dialog)
         entry.pack(pady=5)
         entry.insert(0, str(self.min_content_length.get()))
@@ -888,9 +2212,7 @@ class MemoHelperApp:
         self.apply_fonts()  # Apply the new fonts immediately
 
     def apply_fonts(self):
-        self.section_label.config(font=self.title_S_font)
-        self.title_label.config(font=self.title_L_font)
-        self.content_text.config(font=self.context_M_font)
+        self.layout_engine.reflow()
         self.show_entry()
 
     def create_theme(self, modify=False, theme_name=None):
@@ -1014,7 +2336,473 @@ class MemoHelperApp:
         tk.OptionMenu(dialog, theme_var, *theme_options).pack()
         tk.Button(dialog, text="Delete", command=delete_selected_theme).pack()
 
+class FolderIndex:
+    # Cached recursive listing of deck files; a directory is rescanned only when its mtime changes
+    def __init__(self, root, patterns=('N*.md',), recursive=True):
+        self.root = os.path.abspath(root)
+        self.patterns = tuple(patterns)
+        self.recursive = recursive
+        self.directories = {}  # Directory path -> (mtime_ns, matched file names, subdirectory names)
+        self.paths = []  # Matched files relative to root, from the last refresh
+        self.lock = threading.Lock()
+
+    def matches(self, name):
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def scan_directory(self, dir_path, dir_mtime):
+        file_names, subdirectories = [], []
+        with os.scandir(dir_path) as scanner:
+            for item in scanner:
+                if item.name.startswith('.'):
+                    continue
+                if item.is_dir(follow_symlinks=False):
+                    subdirectories.append(item.name)
+                elif self.matches(item.name):
+                    file_names.append(item.name)
+        return dir_mtime, sorted(file_names), sorted(subdirectories)
+
+    def refresh(self):
+        # Does blocking stat calls, so the app runs it on a worker thread
+        with self.lock:
+            directories, files = {}, []
+            pending = [self.root]
+            while pending:
+                dir_path = pending.pop()
+                try:
+                    dir_mtime = os.stat(dir_path).st_mtime_ns
+                    cached = self.directories.get(dir_path)
+                    if cached is None or cached[0] != dir_mtime:
+                        cached = self.scan_directory(dir_path, dir_mtime)
+                except OSError:
+                    continue
+                directories[dir_path] = cached
+                files.extend(os.path.join(dir_path, name) for name in cached[1])
+                if self.recursive:
+                    pending.extend(os.path.join(dir_path, name) for name in cached[2])
+            self.directories = directories
+            self.paths = sorted(os.path.relpath(path, self.root) for path in files)
+            return self.paths
+
+BUNDLE_EXTENSION = '.mxb'
+BUNDLE_SEPARATOR = '::'  # "bundle.mxb::deck.md" addresses one deck inside a bundle
+BUNDLE_TOC = 'memorax-bundle.json'
+STORED_ASSET_EXTENSIONS = ('.png', '.gif', '.jpg', '.jpeg', '.webp')  # Already compressed
+ZIP_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')  # Ends with the file name and extra field lengths
+
+def split_bundle_path(path):
+    bundle_path, separator, deck_name = (path or "").partition(BUNDLE_SEPARATOR)
+    return (bundle_path, deck_name) if separator else (None, None)
+
+def deck_file_exists(path):
+    bundle_path, deck_name = split_bundle_path(path)
+    return os.path.exists(bundle_path or path)
+
+def build_bundle(folder, output_path, patterns=('N*.md',)):
+    # Zip layout: table of contents, pre-parsed entry tables, source markdown, then assets,
+    # so everything needed to open a deck sits in one contiguous region at the start of the file
+    folder = os.path.abspath(folder)
+    toc = {"format": "memorax-bundle", "version": 1, "decks": [], "assets": []}
+    tables = []
+    assets = {}  # Archive name -> source path
+    for number, name in enumerate(FolderIndex(folder, patterns).refresh()):
+        source_path = os.path.join(folder, name)
+        sections, section_numbers, rows, images = [], {}, [], {}
+        for entry in parse_file(source_path):
+            key = tuple(entry.section_titles)
+            if key not in section_numbers:
+                section_numbers[key] = len(sections)
+                sections.append(entry.section_titles)
+            rows.append([entry.indent_level, entry.title, entry.content, section_numbers[key]])
+            url_runs = [run for run in entry.inline_runs if run[2] in ("image", "link")]
+            for run, url in zip(url_runs, entry.links):
+                image_path = resolve_image_path(os.path.dirname(source_path), url) if run[2] == "image" else None
+                if image_path:
+                    if os.path.commonpath([image_path, folder]) == folder:
+                        arcname = 'assets/' + os.path.relpath(image_path, folder).replace(os.sep, '/')
+                    else:
+                        arcname = f"assets/_external/{zlib.crc32(image_path.encode('utf-8')):08x}_{os.path.basename(image_path)}"
+                    images[url] = arcname
+                    assets[arcname] = image_path
+        deck_name = name.replace(os.sep, '/')
+        table_name = f"tables/{number}.json"
+        toc["decks"].append({"name": deck_name, "table": table_name, "source": f"decks/{deck_name}",
+                             "entries": len(rows), "images": images})
+        tables.append((table_name, json.dumps({"sections": sections, "entries": rows}, ensure_ascii=False)))
+    toc["assets"] = sorted(assets)
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr(BUNDLE_TOC, json.dumps(toc, ensure_ascii=False))
+        for table_name, table in tables:
+            bundle.writestr(table_name, table)
+        for deck in toc["decks"]:
+            bundle.write(os.path.join(folder, deck["name"]), deck["source"])
+        for arcname in toc["assets"]:
+            stored = arcname.lower().endswith(STORED_ASSET_EXTENSIONS)
+            bundle.write(assets[arcname], arcname, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+    return toc
+
+class DeckBundle:
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.mtime_ns = os.stat(self.path).st_mtime_ns
+        self.extract_folder = os.path.join(BUNDLE_FOLDER, f"{zlib.crc32(self.path.encode('utf-8')):08x}-{self.mtime_ns}")
+        self.zip = zipfile.ZipFile(self.path)
+        self.lock = threading.Lock()
+        members = self.read_head()
+        self.toc = json.loads(members[BUNDLE_TOC])
+        self.decks = {deck["name"]: deck for deck in self.toc["decks"]}
+        self.tables = {deck["name"]: json.loads(members[deck["table"]]) for deck in self.toc["decks"]}
+
+    def read_head(self):
+        # Read the table of contents and every entry table with one sequential read,
+        # then inflate each member from that buffer using its local file header
+        infos = sorted(self.zip.infolist(), key=lambda info: info.header_offset)
+        head = [info for info in infos if info.filename == BUNDLE_TOC or info.filename.startswith('tables/')]
+        if not head:
+            raise KeyError(BUNDLE_TOC)
+        start = head[0].header_offset
+        following = [info.header_offset for info in infos if info.header_offset > head[-1].header_offset]
+        end = following[0] if following else self.zip.start_dir
+        with open(self.path, 'rb') as file:
+            file.seek(start)
+            buffer = file.read(end - start)
+        members = {}
+        for info in head:
+            position = info.header_offset - start
+            header = ZIP_LOCAL_HEADER.unpack_from(buffer, position)
+            position += ZIP_LOCAL_HEADER.size + header[-2] + header[-1]
+            data = buffer[position:position + info.compress_size]
+            if info.compress_type == zipfile.ZIP_DEFLATED:
+                data = zlib.decompress(data, -15)
+            if zlib.crc32(data) != info.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC for {info.filename}")
+            members[info.filename] = data.decode('utf-8')
+        return members
+
+    def deck_names(self):
+        return [deck["name"] for deck in self.toc["decks"]]
+
+    def load_entries(self, deck_name):
+        table = self.tables[deck_name]
+        sections = table["sections"]
+        section_ids = [section_path_id(titles) for titles in sections]
+        return [Entry(indent_level, title, content, list(sections[section]), section_ids[section])
+                for indent_level, title, content, section in table["entries"]]
+
+    def extract_asset(self, deck_name, url):
+        # Assets are streamed out of the zip the first time they are needed
+        arcname = self.decks.get(deck_name, {}).get("images", {}).get(url)
+        if not arcname:
+            return None
+        target = os.path.abspath(os.path.join(self.extract_folder, *arcname.split('/')))
+        if os.path.commonpath([target, self.extract_folder]) != self.extract_folder:
+            return None
+        with self.lock:
+            if not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with self.zip.open(arcname) as source, open(target + '.part', 'wb') as destination:
+                    shutil.copyfileobj(source, destination)
+                os.replace(target + '.part', target)
+        return target
+
+    def close(self):
+        self.zip.close()
+
+def anki_field(text):
+    return html.escape(text or '').replace('\t', ' ').replace('\n', '<br>')
+
+def anki_tag(section_titles):
+    return '::'.join(re.sub(r'\s+', '_', title) for title in section_titles if title)
+
+class TsvExporter:
+    # Anki-importable notes: front, back and the section path as a hierarchical tag
+    extension = '.tsv'
+
+    def __init__(self, file):
+        self.file = file
+        file.write('#separator:tab\n#html:true\n#tags column:3\n')
+
+    def write(self, index, entry):
+        front = entry.title if entry.title else entry.content
+        self.file.write(f"{anki_field(front)}\t{anki_field(entry.content)}\t{anki_tag(entry.section_titles)}\n")
+
+class CsvExporter:
+    extension = '.csv'
+
+    def __init__(self, file):
+        self.writer = csv.writer(file)
+        self.writer.writerow(["index", "indent_level", "title", "content", "section_path"])
+
+    def write(self, index, entry):
+        self.writer.writerow([index, entry.indent_level, entry.title or "", entry.content, " > ".join(entry.section_titles)])
+
+class JsonlExporter:
+    extension = '.jsonl'
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, index, entry):
+        self.file.write(json.dumps({
+            "index": index,
+            "indent_level": entry.indent_level,
+            "title": entry.title,
+            "content": entry.content,
+            "section_titles": entry.section_titles,
+        }, ensure_ascii=False) + '\n')
+
+EXPORTERS = {"tsv": TsvExporter, "csv": CsvExporter, "jsonl": JsonlExporter}
+
+def export_file(source_path, destination_path, export_format):
+    # Streams entries straight from the source lines to the destination, so memory stays constant
+    exporter_class = EXPORTERS[export_format]
+    count = 0
+    os.makedirs(os.path.dirname(destination_path) or '.', exist_ok=True)
+    with open(source_path, 'r', encoding=detect_file_encoding(source_path), errors='replace') as source, \
+            open(destination_path, 'w', encoding='utf-8', newline='') as destination:
+        exporter = exporter_class(destination)
+        for index, entry in enumerate(iter_entries(source)):
+            exporter.write(index, entry)
+            count += 1
+    return count
+
+def export_folder(folder, output_folder, export_format, pattern='N*.md', recursive=False, jobs=None):
+    extension = EXPORTERS[export_format].extension
+    jobs_list = []
+    for dir_path, dir_names, file_names in os.walk(folder):
+        for file_name in sorted(fnmatch.filter(file_names, pattern)):
+            source_path = os.path.join(dir_path, file_name)
+            relative_path = os.path.splitext(os.path.relpath(source_path, folder))[0] + extension
+            jobs_list.append((source_path, os.path.join(output_folder, relative_path)))
+        if not recursive:
+            break
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [(source_path, executor.submit(export_file, source_path, destination_path, export_format))
+                   for source_path, destination_path in jobs_list]
+        for source_path, future in futures:
+            try:
+                yield source_path, future.result(), None
+            except (OSError, UnicodeDecodeError) as error:
+                yield source_path, 0, error
+
+def export(argv):
+    parser = argparse.ArgumentParser(prog="Memorax.py export", description="Export decks to Anki TSV, CSV or JSONL.")
+    parser.add_argument("output", help="folder to write the exported files to")
+    parser.add_argument("--format", choices=sorted(EXPORTERS), default="tsv")
+    parser.add_argument("--folder", default=load_config().get("content_folder", os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--pattern", default="N*.md")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    failed = False
+    for source_path, count, error in export_folder(args.folder, args.output, args.format, args.pattern, args.recursive, args.jobs):
+        if error:
+            failed = True
+            print(f"{source_path}: {error}", file=sys.stderr)
+        else:
+            print(f"{source_path}: {count} entries")
+    sys.exit(1 if failed else 0)
+
+def bundle(argv):
+    parser = argparse.ArgumentParser(prog="Memorax.py bundle", description="Pack a folder of decks into a single bundle file.")
+    parser.add_argument("output", help="bundle file to write (" + BUNDLE_EXTENSION + ")")
+    parser.add_argument("--folder", default=load_config().get("content_folder", os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--pattern", action="append", help="glob pattern for deck files (default: N*.md)")
+    args = parser.parse_args(argv)
+    toc = build_bundle(args.folder, args.output, args.pattern or ['N*.md'])
+    print(f"{args.output}: {len(toc['decks'])} deck(s), {sum(deck['entries'] for deck in toc['decks'])} entries, {len(toc['assets'])} asset(s)")
+
+class DeckServer:
+    def __init__(self, content_folder, max_sessions=10000):
+        self.content_folder = os.path.abspath(content_folder)
+        self.max_sessions = max_sessions
+        self.decks = {}  # Deck path -> (mtime_ns, entries), parsed once and shared by all clients
+        self.sessions = OrderedDict()  # Session id -> {"deck": path, "index": int}
+        self.routes = {
+            "/decks": self.handle_decks,
+            "/entry": self.handle_entry,
+            "/next": self.handle_next,
+            "/previous": self.handle_previous,
+            "/random": self.handle_random,
+        }
+
+    def resolve_deck(self, name):
+        path = os.path.abspath(os.path.join(self.content_folder, name))
+        if os.path.commonpath([path, self.content_folder]) != self.content_folder or not path.endswith('.md'):
+            raise KeyError(name)
+        return path
+
+    def get_entries(self, path):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            raise KeyError(os.path.relpath(path, self.content_folder))  # Never expose server paths to clients
+        cached = self.decks.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, parse_file(path))
+            self.decks[path] = cached
+        return cached[1]
+
+    def get_session(self, params):
+        session_id = params.get("session")
+        session = self.sessions.get(session_id) if session_id else None
+        if session is None:
+            session_id = uuid.uuid4().hex
+            session = {"deck": None, "index": 0}
+            self.sessions[session_id] = session
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+        else:
+            self.sessions.move_to_end(session_id)
+        return session_id, session
+
+    def entry_response(self, session_id, session, entries):
+        entry = entries[session["index"]]
+        return {
+            "session": session_id,
+            "deck": os.path.relpath(session["deck"], self.content_folder),
+            "index": session["index"],
+            "total": len(entries),
+            "title": entry.title,
+            "content": entry.content,
+            "section_titles": entry.section_titles,
+        }
+
+    def session_deck(self, params):
+        session_id, session = self.get_session(params)
+        if "deck" in params:
+            deck = self.resolve_deck(params["deck"])
+            if deck != session["deck"]:
+                session["deck"] = deck
+                session["index"] = 0
+        if session["deck"] is None:
+            raise KeyError("deck")
+        entries = self.get_entries(session["deck"])
+        if not entries:
+            raise KeyError(session["deck"])
+        session["index"] = min(session["index"], len(entries) - 1)
+        return session_id, session, entries
+
+    def handle_decks(self, params):
+        decks = []
+        for dir_path, dir_names, file_names in os.walk(self.content_folder):
+            for file_name in fnmatch.filter(file_names, '*.md'):
+                decks.append(os.path.relpath(os.path.join(dir_path, file_name), self.content_folder))
+        return {"decks": sorted(decks)}
+
+    def handle_entry(self, params):
+        session_id, session, entries = self.session_deck(params)
+        if "index" in params:
+            session["index"] = int(params["index"]) % len(entries)
+        return self.entry_response(session_id, session, entries)
+
+    def handle_next(self, params):
+        session_id, session, entries = self.session_deck(params)
+        session["index"] = (session["index"] + 1) % len(entries)
+        return self.entry_response(session_id, session, entries)
+
+    def handle_previous(self, params):
+        session_id, session, entries = self.session_deck(params)
+        session["index"] = (session["index"] - 1) % len(entries)
+        return self.entry_response(session_id, session, entries)
+
+    def handle_random(self, params):
+        session_id, session, entries = self.session_deck(params)
+        min_length = int(params.get("min_length", 0))
+        valid_entries = [i for i, entry in enumerate(entries) if len(entry.content) >= min_length]
+        if not valid_entries:
+            raise KeyError("min_length")
+        session["index"] = random.choice(valid_entries)
+        return self.entry_response(session_id, session, entries)
+
+    def dispatch(self, target):
+        url = urlsplit(target)
+        handler = self.routes.get(url.path)
+        if handler is None:
+            return 404, {"error": "unknown endpoint"}
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            return 200, handler(params)
+        except KeyError as error:
+            return 404, {"error": f"not found: {error.args[0]}"}
+        except (ValueError, UnicodeDecodeError) as error:
+            return 400, {"error": str(error)}
+
+    async def handle_connection(self, reader, writer):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                   431: "Request Header Fields Too Large"}
+        try:
+            while True:
+                headers = {}
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:  # A line longer than the stream limit
+                    request_line = None
+                parts = request_line.decode('latin-1').split() if request_line else []
+                keep_alive = False
+                if request_line is None:
+                    status, payload = 431, {"error": "request line or header too long"}
+                elif len(parts) != 3:
+                    break
+                elif parts[0] != "GET":
+                    # The body is not read, so the connection cannot be reused
+                    status, payload = 405, {"error": "only GET is supported"}
+                elif not headers.get("content-length", "0").isdigit() or "transfer-encoding" in headers:
+                    status, payload = 400, {"error": "unsupported request body"}
+                else:
+                    await reader.readexactly(int(headers.get("content-length", "0")))
+                    method, target, version = parts
+                    status, payload = self.dispatch(target)
+                    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {reasons[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Access-Control-Allow-Origin: *\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        print(f"Serving {self.content_folder} on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+def serve(argv):
+    parser = argparse.ArgumentParser(prog="Memorax.py serve", description="Serve decks as JSON over HTTP.")
+    parser.add_argument("--folder", default=load_config().get("content_folder", os.path.dirname(os.path.abspath(__file__))))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(DeckServer(args.folder).serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        export(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "bundle":
+        bundle(sys.argv[2:])
+        return
     root = tk.Tk()
     root.title("Memorax")
     app = MemoHelperApp(root, [])
@@ -0,0 +1,84 @@
+import argparse
+import random
+import sys
+import time
+
+from Memorax import parse_entries, parse_entries_bytes
+
+# Benchmark of the byte-level parser against the str-based parse_entries on UTF-8 and GB18030 decks.
+# The str baseline is timed the way the app used to load files: decode everything, split lines, parse.
+
+# Lines where the byte patterns have to agree with the Unicode-aware \s and \d of the str parser
+EDGE_CASES = (
+    "# 边界情况\n"
+    "１. 全角数字：内容\n"
+    "٣ Arabic-Indic digit: content\n"
+    "\xa0- NBSP indent: content\n"
+    "\u2003- em space indent：内容\n"
+    "\u3000- 全角空格缩进：内容\n"
+    "\x0c- form feed: starts a new line\n"
+    "\x1f- unit separator: is whitespace\n"
+    "  \x0b- vertical tab: starts a new line\n"
+    "- carriage return: old Mac line end\r- next: entry\r\n"
+    "\t• bullet: 内容\n"
+    "普通文本，不是条目\n"
+)
+
+WORDS = ["机器学习", "人工智能", "数据", "模型", "训练", "梯度", "网络", "memory", "cache", "index", "概率", "分布"]
+
+def generate_deck(entries):
+    rng = random.Random(42)
+    lines = ["# 测试笔记\n"]
+    for i in range(entries):
+        if i % 200 == 0:
+            lines.append(f"## 第{i // 200 + 1}章 概述\n")
+        if i % 50 == 0:
+            lines.append(f"### 小节 {i // 50}\n")
+        text = "，".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25)))
+        marker = rng.choice(["-", "•", f"{i}.", "  -", "　-"])
+        if i % 7 == 0:
+            lines.append(f"{marker} {text}。\n")
+        else:
+            lines.append(f"{marker} 条目{i}{rng.choice(['：', ':'])} {text}；{text}。\n")
+        if i % 5 == 0:
+            lines.append("这是一段普通的说明文字，不会被解析为条目。\n")
+        if i % 1000 == 0:
+            lines.append(EDGE_CASES)
+    return "".join(lines)
+
+def same_entries(first, second):
+    key = lambda entry: (entry.indent_level, entry.title, entry.content, entry.section_titles, entry.section_id)
+    return len(first) == len(second) and all(key(a) == key(b) for a, b in zip(first, second))
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the byte-level parser against parse_entries.")
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    text = generate_deck(args.entries)
+    ok = True
+    for encoding in ("utf-8", "gb18030"):
+        for sample in (EDGE_CASES, EDGE_CASES + "- line separator\u2028splits: lines\n"):
+            if not same_entries(parse_entries(sample.splitlines(keepends=True)), parse_entries_bytes(sample.encode(encoding))):
+                print(f"{encoding:8} edge cases: MISMATCH")
+                ok = False
+        data = text.encode(encoding)
+        baseline, expected = best_time(lambda: parse_entries(data.decode(encoding).splitlines(keepends=True)), args.repeat)
+        fast, actual = best_time(lambda: parse_entries_bytes(data), args.repeat)
+        match = same_entries(expected, actual)
+        ok = ok and match
+        print(f"{encoding:8} {len(data) / 1e6:6.1f} MB {len(expected):7} entries  "
+              f"str {baseline * 1000:8.1f} ms  bytes {fast * 1000:8.1f} ms  "
+              f"speedup {baseline / fast:4.2f}x  {'identical' if match else 'MISMATCH'}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
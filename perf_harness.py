@@ -0,0 +1,389 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import tkinter as tk
+
+# Headless performance harness for the UI hot paths of MemoHelperApp. Every widget talks to Tcl through
+# root.tk, so the harness swaps it for a RecordingTkApp that counts Tcl round-trips per operation. With a
+# display (or under xvfb-run) the calls go to real Tk; without one a TkStub answers the Tk commands in
+# Python while a plain Tcl interpreter still handles variables and callbacks. Exits non-zero when an
+# operation goes over its call budget, or with real Tk, over its time budget.
+
+TK_COMMANDS = {
+    'button', 'canvas', 'checkbutton', 'entry', 'frame', 'label', 'labelframe', 'listbox', 'menu', 'menubutton',
+    'message', 'radiobutton', 'scale', 'scrollbar', 'spinbox', 'text', 'toplevel', 'panedwindow',
+    'after', 'bell', 'bind', 'bindtags', 'clipboard', 'destroy', 'event', 'focus', 'font', 'grab', 'grid',
+    'image', 'lower', 'option', 'pack', 'place', 'raise', 'selection', 'tk', 'tkwait', 'update', 'winfo', 'wm',
+    'tk_getOpenFile', 'tk_getSaveFile', 'tk_chooseDirectory', 'tk_chooseColor', 'tk_messageBox', 'tk_popup',
+}
+
+# Operation -> max Tk widget calls per call: the counts measured against the stub plus a few calls of headroom.
+# A per-entry loop over the deck or a per-widget loop over the jump list blows through these at once
+CALL_BUDGETS = {
+    "load_selected_file": 16,
+    "switch_tab": 30,
+    "show_entry": 9,
+    "show_next": 9,
+    "show_previous": 9,
+    "show_next_with_content": 24,
+    "set_theme": 32,
+    "apply_visibility_mode": 4,
+    "set_layout_mode": 16,
+    "resize": 12,
+}
+
+# Operation -> max milliseconds per call, checked only against real Tk because stub timings say little about
+# rendering. Interactive operations have to fit in one 60 Hz frame; opening a deck includes parsing it
+TIME_BUDGETS_MS = {
+    "load_selected_file": 250.0,
+    "switch_tab": 16.0,
+    "show_entry": 16.0,
+    "show_next": 16.0,
+    "show_previous": 16.0,
+    "show_next_with_content": 16.0,
+    "set_theme": 16.0,
+    "apply_visibility_mode": 16.0,
+    "set_layout_mode": 16.0,
+    "resize": 16.0,
+}
+
+class StubWidget:
+    def __init__(self, kind, options):
+        self.kind = kind
+        self.options = options
+        self.items = []  # Listbox items or menu entries
+
+class TkStub:
+    # Minimal in-memory answers for the Tk commands the app uses; anything unknown returns ""
+    def __init__(self, interp):
+        self.interp = interp
+        self.widgets = {'.': StubWidget('toplevel', {})}
+        self.fonts = {}
+        self.images = {}
+        self.pending = {}  # after id -> script
+        self.next_id = 0
+
+    def new_id(self, prefix):
+        self.next_id += 1
+        return f"{prefix}{self.next_id}"
+
+    def call(self, args):
+        head = str(args[0])
+        if head.startswith('.'):
+            return self.widget_command(self.widgets.get(head) or self.widgets.setdefault(head, StubWidget('', {})), args[1:])
+        handler = getattr(self, 'cmd_' + head.replace('::', '_'), None)
+        if handler:
+            return handler(*args[1:])
+        if head in TK_COMMANDS and len(args) > 1 and str(args[1]).startswith('.'):  # Widget creation
+            self.widgets[str(args[1])] = StubWidget(head, options(args[2:]))
+            return str(args[1])
+        return ''
+
+    def widget_command(self, widget, args):
+        if not args:
+            return ''
+        command, rest = str(args[0]), args[1:]
+        if command in ('configure', 'config', 'entryconfigure', 'tag', 'image'):
+            if command == 'configure' and len(rest) == 1:
+                return ('', '', '', '', widget.options.get(str(rest[0]), ''))
+            if command == 'configure':
+                widget.options.update(options(rest))
+            if command == 'image' and rest and rest[0] in ('cget',):
+                return ''
+            return ''
+        if command == 'cget':
+            return widget.options.get(str(rest[0]), '')
+        if widget.kind == 'listbox':
+            return self.listbox_command(widget, command, rest)
+        if widget.kind == 'menu':
+            if command == 'add':
+                widget.items.append(options(rest[1:]))
+            elif command == 'delete':
+                widget.items = []
+            elif command == 'index':
+                return str(len(widget.items) - 1) if widget.items else 'none'
+            return ''
+        if widget.kind == 'text':
+            if command == 'index':
+                return '1.0'
+            if command == 'count':
+                return 0
+            return ''
+        return ''
+
+    def listbox_command(self, widget, command, rest):
+        if command == 'insert':
+            position = len(widget.items) if rest[0] == 'end' else int(rest[0])
+            widget.items[position:position] = [str(item) for item in rest[1:]]
+        elif command == 'delete':
+            first = int(rest[0])
+            last = len(widget.items) if len(rest) < 2 or rest[1] == 'end' else int(rest[1]) + 1
+            del widget.items[first:last]
+        elif command == 'size':
+            return len(widget.items)
+        elif command == 'get':
+            return widget.items[int(rest[0])] if len(rest) == 1 and int(rest[0]) < len(widget.items) else ''
+        elif command in ('index', 'nearest'):
+            return 0
+        return ''
+
+    def cmd_after(self, *args):
+        if args[0] == 'cancel':
+            self.pending.pop(str(args[1]), None)
+            return ''
+        if args[0] == 'info':
+            if len(args) == 1:
+                return tuple(self.pending)
+            if str(args[1]) not in self.pending:  # Fired or cancelled; Tcl raises and tkinter catches it
+                raise tk.TclError(f'event "{args[1]}" doesn\'t exist')
+            return (self.pending[str(args[1])], 'timer')
+        if len(args) == 1:  # Plain sleep
+            return ''
+        after_id = self.new_id('after#')
+        self.pending[after_id] = ' '.join(str(arg) for arg in args[1:])
+        return after_id
+
+    def cmd_update(self, *args):
+        return ''
+
+    def cmd_winfo(self, command, *args):
+        if command in ('width', 'reqwidth', 'screenwidth'):
+            return 800
+        if command in ('height', 'reqheight', 'screenheight'):
+            return 600
+        if command in ('exists', 'ismapped', 'viewable'):
+            return 1
+        if command == 'children':
+            prefix = str(args[0]).rstrip('.') + '.'
+            return tuple(path for path in self.widgets if path.startswith(prefix) and '.' not in path[len(prefix):])
+        if command == 'toplevel':
+            return '.'
+        if command in ('fpixels', 'pixels'):
+            return 1
+        return 0
+
+    def cmd_wm(self, command, *args):
+        if command == 'geometry':
+            return '800x600+0+0'
+        if command == 'state':
+            return 'normal'
+        return ''
+
+    def cmd_font(self, command, *args):
+        if command == 'create':
+            named = bool(args) and not str(args[0]).startswith('-')
+            name = str(args[0]) if named else self.new_id('font')
+            self.fonts[name] = {'-family': 'SimSun', '-size': 10, '-weight': 'normal', '-slant': 'roman',
+                                '-underline': 0, '-overstrike': 0}
+            self.fonts[name].update(options(args[1:] if named else args))
+            return name
+        if command in ('configure', 'actual'):
+            font = self.fonts.get(str(args[0]), {'-family': 'SimSun', '-size': 10, '-weight': 'normal'})
+            if len(args) == 2 or (command == 'actual' and len(args) > 1 and str(args[-1]).startswith('-')):
+                return font.get(str(args[-1]), '')
+            if len(args) > 2:
+                font.update(options(args[1:]))
+                return ''
+            return tuple(item for pair in font.items() for item in pair)
+        if command == 'metrics':
+            return 15 if len(args) > 1 and str(args[-1]).startswith('-') else ('-ascent', 12, '-descent', 3, '-linespace', 15, '-fixed', 0)
+        if command == 'measure':
+            return 8 * len(str(args[-1]))
+        if command == 'families':
+            return ('SimSun', 'Arial', 'Courier')
+        if command == 'names':
+            return tuple(self.fonts)
+        if command == 'delete':
+            self.fonts.pop(str(args[0]), None)
+        return ''
+
+    def cmd_image(self, command, *args):
+        if command == 'create':
+            name = self.new_id('image')
+            self.images[name] = options(args[1:])
+            return name
+        if command in ('width', 'height'):
+            return 100
+        if command == 'names':
+            return tuple(self.images)
+        if command == 'delete':
+            for name in args:
+                self.images.pop(str(name), None)
+        return ''
+
+    def cmd_tk(self, command, *args):
+        if command == 'windowingsystem':
+            return 'x11'
+        if command == 'scaling':
+            return 1.0
+        return ''
+
+    def cmd_tk_messageBox(self, *args):
+        return 'ok'
+
+    def cmd_destroy(self, *paths):
+        for path in paths:
+            for name in [name for name in self.widgets if name == path or name.startswith(str(path) + '.')]:
+                del self.widgets[name]
+        return ''
+
+def options(args):
+    args = [str(arg) for arg in args]
+    return dict(zip(args[0::2], args[1::2]))
+
+class RecordingTkApp:
+    # Wraps the tkapp object shared by all widgets; counts every Tcl round-trip and the Tk commands among them
+    def __init__(self, interp, stub=None):
+        self.interp = interp
+        self.stub = stub
+        self.round_trips = 0
+        self.widget_calls = 0
+        self.commands = Counter()
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        self.round_trips += 1
+        head = str(args[0]) if args else ''
+        if head.startswith('.') or head in TK_COMMANDS:
+            self.widget_calls += 1
+            self.commands[f"{head if not head.startswith('.') else 'widget'} {args[1] if len(args) > 1 else ''}"] += 1
+            if self.stub:
+                return self.stub.call(args)
+        return self.interp.call(*args)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.interp, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.round_trips += 1
+            return attribute(*args, **kwargs)
+        return counted
+
+    def reset(self):
+        self.round_trips = self.widget_calls = 0
+        self.commands.clear()
+
+    def drain(self):
+        # Runs pending after/after_idle callbacks immediately so deferred rendering is charged to the operation
+        if not self.stub:
+            self.interp.call('update')
+            return
+        for _ in range(1000):
+            if not self.stub.pending:
+                break
+            after_id, script = next(iter(self.stub.pending.items()))
+            del self.stub.pending[after_id]
+            self.interp.eval(script)
+
+def create_root(use_stub):
+    if not use_stub:
+        try:
+            root = tk.Tk()
+            root.tk = RecordingTkApp(root.tk)
+            return root, "tk"
+        except tk.TclError:
+            pass
+    root = tk.Tk(useTk=False)
+    root.tk = RecordingTkApp(root.tk, TkStub(root.tk))
+    root._tkloaded = True
+    tk._default_root = root
+    return root, "stub"
+
+def write_deck(folder, count, name='N_harness.md'):
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("# Harness\n")
+        for i in range(count):
+            if i % 100 == 0:
+                file.write(f"## Chapter {i // 100}\n### Section {i // 100}\n")
+            file.write(f"- Entry {i}: content with **bold**, `code` and *italic* text for entry {i}\n")
+    return path
+
+def measure(recorder, name, operation, repeat):
+    recorder.drain()
+    recorder.reset()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+        recorder.drain()
+    elapsed = (time.perf_counter() - started) * 1000 / repeat
+    return name, recorder.widget_calls / repeat, recorder.round_trips / repeat, elapsed, recorder.commands.most_common(3)
+
+def main():
+    parser = argparse.ArgumentParser(description="Count Tcl round-trips and time the MemoHelperApp UI hot paths.")
+    parser.add_argument("--stub", action="store_true", help="use the Tk stub even when a display is available")
+    parser.add_argument("--entries", type=int, default=5000, help="entries in the generated deck")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--verbose", action="store_true", help="show the most frequent Tk commands per operation")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp()
+    os.environ['HOME'] = os.environ['USERPROFILE'] = home  # Keep the harness away from the real config
+    import Memorax
+
+    root, backend = create_root(args.stub)
+    recorder = root.tk
+    deck = write_deck(home, args.entries)
+    other_deck = write_deck(home, args.entries, 'N_harness_other.md')
+    app = Memorax.MemoHelperApp(root, [])
+    app.content_folder = home
+
+    themes = iter(["dark", "light"] * args.repeat)
+    modes = iter(["hide_list", "show_list_only", "show_list_and_scrollbar"] * args.repeat)
+
+    def cold_load():
+        app.deck_store.discard(deck)  # Parse and populate the jump list every time instead of hitting the store
+        app.load_selected_file(deck)
+
+    layouts = iter([app.set_compact_mode, app.set_wide_mode, app.set_normal_mode] * args.repeat)
+    widths = iter([600, 700] * args.repeat)
+
+    def resize():
+        # What Tk delivers when the user drags the window narrower; the reflow runs from its own timer
+        event = tk.Event()
+        event.widget, event.width = root, next(widths)
+        app.layout_engine.on_configure(event)
+
+    def switch_mode():
+        app.visibility_mode.set(next(modes))
+        app.apply_visibility_mode()
+
+    results = [
+        measure(recorder, "load_selected_file", cold_load, 3),
+    ]
+    app.new_tab(other_deck)
+    results += [
+        measure(recorder, "switch_tab", lambda: app.cycle_tab(1), 10),
+        measure(recorder, "show_entry", app.show_entry, args.repeat),
+        measure(recorder, "show_next", app.show_next, args.repeat),
+        measure(recorder, "show_previous", app.show_previous, args.repeat),
+        measure(recorder, "show_next_with_content", lambda: (app.show_next(), app.display_content()), args.repeat),
+        measure(recorder, "set_theme", lambda: app.set_theme(next(themes)), args.repeat),
+        measure(recorder, "apply_visibility_mode", switch_mode, args.repeat),
+        measure(recorder, "set_layout_mode", lambda: next(layouts)(), args.repeat),
+        measure(recorder, "resize", resize, args.repeat),
+    ]
+
+    print(f"backend: {backend}, deck: {args.entries} entries")
+    failed = False
+    for name, widget_calls, round_trips, elapsed, top in results:
+        max_calls = CALL_BUDGETS[name]
+        max_ms = TIME_BUDGETS_MS[name] if backend == "tk" else None
+        over = widget_calls > max_calls or (max_ms is not None and elapsed > max_ms)
+        failed = failed or over
+        budget = f"{max_calls} calls" + (f" / {max_ms:.0f} ms" if max_ms is not None else "")
+        print(f"{name:22} {widget_calls:7.1f} widget calls {round_trips:7.1f} round-trips {elapsed:8.2f} ms  "
+              f"(budget {budget}){'  OVER BUDGET' if over else ''}")
+        if args.verbose:
+            print("    " + ", ".join(f"{command.strip()} x{count}" for command, count in top))
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from Memorax import DeckServer
+
+# Load test for `python Memorax.py serve`: starts a server on a sample deck (or targets a running one)
+# and drives it with many keep-alive clients, failing when throughput drops below --min-rps.
+
+def write_sample_deck(folder, count):
+    with open(os.path.join(folder, 'N_loadtest.md'), 'w', encoding='utf-8') as file:
+        file.write("# Load Test\n### Section\n")
+        for i in range(count):
+            file.write(f"- Entry{i}: 内容{i}；more content for entry {i}。\n")
+    return 'N_loadtest.md'
+
+async def client(host, port, deck, requests, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    session = ""
+    paths = ["/next", "/previous", "/random", "/entry"]
+    try:
+        for i in range(requests):
+            target = f"{paths[i % len(paths)]}?deck={deck}&session={session}"
+            started = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            length = 0
+            status = await reader.readline()
+            while True:
+                line = await reader.readline()
+                if line == b'\r\n':
+                    break
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            body = await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if b' 200 ' not in status:
+                raise RuntimeError(f"{target}: {status.decode().strip()} {body.decode()}")
+            session = json.loads(body)["session"]
+    finally:
+        writer.close()
+
+async def run(args):
+    server = None
+    deck = args.deck
+    if args.port == 0:
+        folder = tempfile.mkdtemp()
+        deck = write_sample_deck(folder, args.entries)
+        server = await asyncio.start_server(DeckServer(folder).handle_connection, args.host, 0)
+        args.port = server.sockets[0].getsockname()[1]
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, deck, args.requests, latencies) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - started
+    if server:
+        server.close()
+        await server.wait_closed()
+    latencies.sort()
+    rps = len(latencies) / elapsed
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f}s: {rps:.0f} req/s, "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms")
+    return rps
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Memorax deck server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="port of a running server; 0 starts one in-process")
+    parser.add_argument("--deck", default="", help="deck name on a running server")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--entries", type=int, default=5000, help="entries in the generated sample deck")
+    parser.add_argument("--min-rps", type=float, default=500)
+    args = parser.parse_args()
+    rps = asyncio.run(run(args))
+    if rps < args.min_rps:
+        print(f"FAIL: below {args.min_rps:.0f} req/s")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()